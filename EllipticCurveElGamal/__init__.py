@@ -1,3 +1,14 @@
 from .elliptic_curve_el_gamal import Point, EllipticCurveElGamal
+from .decryption_session import DecryptionSession
+from .ephemeral_key_pool import EphemeralKeyPool
+from .random_source import RandomSource, SystemRandomSource, NumpyRandomSource
 
-__all__ = ["Point", "EllipticCurveElGamal"]
+__all__ = [
+    "Point",
+    "EllipticCurveElGamal",
+    "DecryptionSession",
+    "EphemeralKeyPool",
+    "RandomSource",
+    "SystemRandomSource",
+    "NumpyRandomSource",
+]
@@ -0,0 +1,97 @@
+from functools import lru_cache
+
+
+class DecryptionSession:
+    def __init__(self, ecc, private_key, cache_size=256, precompute=True):
+        """
+        Initialize a decryption session bound to one private key.
+
+        Every d * C1 is memoized in a bounded LRU cache. When the curve group is small
+        enough for lookup tables, d * P is precomputed for every point instead.
+
+        Args:
+            ecc (EllipticCurveElGamal): The curve the ciphertexts were encrypted on.
+            private_key (int): The private key (d).
+            cache_size (int): Maximum number of d * C1 results kept in the LRU cache.
+            precompute (bool): Build the group tables of a small curve if missing.
+        """
+        self.ecc = ecc
+        self.private_key = private_key
+
+        if ecc.mul_table is None and precompute:
+            try:
+                ecc.build_group_tables()
+            except ValueError:
+                pass  # Group too large for tables, rely on the LRU cache
+
+        # shared_table[i] is the index of d * P_i
+        self.shared_table = None
+        if ecc.mul_table is not None:
+            self.shared_table = ecc.mul_table[:, private_key % len(ecc.valid_points)]
+
+        self._cached_shared_point = lru_cache(maxsize=cache_size)(self._compute_shared_point)
+
+    def _compute_shared_point(self, C1):
+        return self.ecc.scalar_multiply(C1, self.private_key)
+
+    def shared_point(self, C1):
+        """Return d * C1, from the precomputed table or the LRU cache."""
+        if self.shared_table is not None:
+            i = self.ecc.index_of(C1)
+            if i is not None:
+                return self.ecc.valid_points[self.shared_table[i]]
+        return self._cached_shared_point(C1)
+
+    def cache_info(self):
+        """Return the hit/miss statistics of the d * C1 LRU cache."""
+        return self._cached_shared_point.cache_info()
+
+    def decrypt(self, C1, C2):
+        """
+        Decrypt a ciphertext pair (C1, C2).
+
+        Args:
+            C1 (Point): The first ciphertext point.
+            C2 (Point): The second ciphertext point.
+
+        Returns:
+            Point: The plaintext point (P).
+        """
+        return self.ecc.calc_point_subtraction(C2, self.shared_point(C1))
+
+    def decrypt_message(self, ciphertext):
+        """
+        Decrypt a ciphertext produced by ``encrypt_message`` or ``encrypt_message_batch``.
+
+        Args:
+            ciphertext (str): The encrypted message as a string of characters.
+
+        Returns:
+            str: The decrypted plaintext message.
+        """
+        ecc = self.ecc
+        if len(ciphertext) % (2 * ecc.point_text_width()):
+            raise ValueError("Ciphertext must contain an even number of points.")
+
+        if self.shared_table is not None:
+            pairs = ecc.encode_message(ciphertext).reshape(-1, 2)
+            d_C1 = self.shared_table[pairs[:, 0]]
+            return ecc.decode_indices(ecc.add_table[pairs[:, 1], ecc.neg_table[d_C1]])
+
+        points = ecc.text_to_points(ciphertext)
+        plaintext = []
+        for i in range(0, len(points), 2):
+            plaintext.append(ecc.decode_point(self.decrypt(points[i], points[i + 1])))
+        return "".join(plaintext)
+
+    def decrypt_batch(self, ciphertexts):
+        """
+        Decrypt many ciphertexts with the same private key.
+
+        Args:
+            ciphertexts (iterable of str): The encrypted messages.
+
+        Returns:
+            list: The decrypted plaintext messages, in order.
+        """
+        return [self.decrypt_message(ciphertext) for ciphertext in ciphertexts]
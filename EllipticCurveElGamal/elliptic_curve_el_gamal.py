@@ -1,9 +1,31 @@
-import random
+import hashlib
+import math
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .decryption_session import DecryptionSession
+from .ephemeral_key_pool import EphemeralKeyPool
+from .random_source import SystemRandomSource
 
 class Point:
-    def __init__(self, x=None, y=None):
+    # No per-instance __dict__: ciphertext points are held in bulk
+    __slots__ = ("x", "y", "index")
+
+    def __init__(self, x=None, y=None, index=None):
+        """
+        Initialize a point; Point() is the point at infinity.
+
+        Args:
+            x (int, optional): The x-coordinate.
+            y (int, optional): The y-coordinate.
+            index (int, optional): Position of the point in its curve's ``valid_points``.
+                Only set on the shared instances interned by ``EllipticCurveElGamal``.
+        """
         self.x = x
         self.y = y
+        self.index = index
 
     def is_infinity(self):
         """Check if the point is the point at infinity."""
@@ -11,6 +33,8 @@ class Point:
 
     def __eq__(self, other):
         """Custom equality check for Point objects."""
+        if self is other:
+            return True
         if isinstance(other, Point):
             return self.x == other.x and self.y == other.y
         return False
@@ -24,12 +48,98 @@ class Point:
             return "Point at Infinity"
         return f"Point({self.x}, {self.y})"
 
+# Curve instance of a parallel worker process, set up once by _init_worker
+_worker_ecc = None
+
+
+def _init_worker(a, b, p, base_point, order, points, tables):
+    """Set up the curve once per worker from the points and tables built by the parent."""
+    global _worker_ecc
+    _worker_ecc = EllipticCurveElGamal(a, b, p, base_point=base_point, order=order)
+    if points is not None:
+        _worker_ecc._set_points(points)
+    if tables is not None:
+        _worker_ecc.add_table, _worker_ecc.mul_table, _worker_ecc.neg_table = tables
+
+
+def _encrypt_shard(shard, public_key):
+    return _worker_ecc._encrypt_chunk(shard, public_key)
+
+
+def _decrypt_shard(shard, private_key):
+    return _worker_ecc._decrypt_chunk(shard, private_key)
+
+
 class EllipticCurveElGamal:
-  def __init__(self):
-    self.a = 6
-    self.b = 7
-    self.p = 61
-    self.base_point = self.generate_random_valid_point()
+  # Largest group for which the precomputed lookup tables are allowed.
+  TABLE_MAX_POINTS = 1024
+
+  # Window width of the wNAF scalar multiplication.
+  WNAF_WIDTH = 4
+
+  # Window width of the fixed-base table of base point multiples.
+  BASE_WINDOW_WIDTH = 4
+
+  # Koblitz encoding on curves too large to enumerate: character m is the first
+  # point with x in [m * K, m * K + K), which exists except with probability 2^-K.
+  KOBLITZ_K = 64
+
+  # Standard curves: (a, b, p, base point (x, y), order of the base point).
+  CURVES = {
+      "secp256k1": (
+          0,
+          7,
+          0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F,
+          (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+           0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8),
+          0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
+      ),
+      "P-256": (
+          -3,
+          0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+          0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+          (0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+           0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5),
+          0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551,
+      ),
+  }
+
+  def __init__(self, a=6, b=7, p=61, base_point=None, order=None, use_tables=False,
+               cache_dir=None, random_source=None):
+    """
+    Initialize the curve y^2 = x^3 + ax + b over GF(p) and its base point.
+
+    The list of curve points and the character mappings are only built when first
+    needed, so constructing the class does not enumerate the curve.
+
+    Args:
+        a (int): The a coefficient of the curve.
+        b (int): The b coefficient of the curve.
+        p (int): The prime modulus of the curve.
+        base_point (Point or tuple, optional): The base point. If None, a random
+            point on the curve is used.
+        order (int, optional): The order of the base point. Private and ephemeral
+            keys are drawn from [1, order - 1] when given, from [1, p - 1] otherwise.
+        use_tables (bool): Precompute the addition and scalar-multiple tables of the
+            curve group so point arithmetic becomes array lookups.
+        cache_dir (str, optional): Directory in which the point list and group tables
+            are persisted, keyed by (a, b, p), and reloaded on later constructions.
+        random_source (RandomSource, optional): Source of keys and random points.
+            Defaults to a ``SystemRandomSource`` (os.urandom).
+    """
+    self.random_source = random_source or SystemRandomSource()
+    self.a = a % p
+    self.b = b % p
+    self.p = p
+    self.order = order
+    if base_point is None:
+        self.base_point = self.generate_random_valid_point()
+    else:
+        if not isinstance(base_point, Point):
+            base_point = Point(*base_point)
+        if base_point.is_infinity() or not self.is_on_curve(base_point.x, base_point.y):
+            raise ValueError(f"Base point {base_point} is not on the curve.")
+        self.base_point = base_point
 
     self.characters = [
         'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h',
@@ -42,8 +152,147 @@ class EllipticCurveElGamal:
         '*', '(', ')', '-', '_', '=', '+', '~'
     ]
 
-    self.valid_points = self.get_all_points()
-    self.point_to_char, self.char_to_point = self.create_mappings()
+    self.cache_dir = cache_dir
+    self._base_table = None
+    self._base_table_point = None
+    self._valid_points = None
+    self._point_index = None
+    self._point_to_char = None
+    self._char_to_point = None
+
+    self.add_table = None
+    self.mul_table = None
+    self.neg_table = None
+    if use_tables:
+        self.build_group_tables()
+
+  @classmethod
+  def from_name(cls, name, **kwargs):
+      """
+      Create an instance for one of the standard curves in ``CURVES``.
+
+      Args:
+          name (str): The curve name, e.g. "secp256k1" or "P-256".
+          **kwargs: Further keyword arguments for the constructor.
+
+      Returns:
+          EllipticCurveElGamal: The instance using the named curve.
+      """
+      if name not in cls.CURVES:
+          raise ValueError(f"Unknown curve '{name}'. Choose from {sorted(cls.CURVES)}.")
+      a, b, p, base_point, order = cls.CURVES[name]
+      return cls(a, b, p, base_point=base_point, order=order, **kwargs)
+
+  def max_scalar(self):
+      """Return the largest private or ephemeral key drawn for this curve."""
+      return self.order - 1 if self.order else self.p - 1
+
+  @property
+  def valid_points(self):
+      """All points on the curve, enumerated on first access."""
+      if self._valid_points is None:
+          self._build_points()
+      return self._valid_points
+
+  @property
+  def point_index(self):
+      """Mapping of every curve point to its index in ``valid_points``."""
+      if self._point_index is None:
+          self._build_points()
+      return self._point_index
+
+  @property
+  def point_to_char(self):
+      """Mapping of curve points to characters, built on first access."""
+      if self._point_to_char is None:
+          self._point_to_char, self._char_to_point = self.create_mappings()
+      return self._point_to_char
+
+  @property
+  def char_to_point(self):
+      """Mapping of characters to curve points, built on first access."""
+      if self._char_to_point is None:
+          self._point_to_char, self._char_to_point = self.create_mappings()
+      return self._char_to_point
+
+  def is_enumerable(self):
+      """
+      Whether the curve is small enough to enumerate its points.
+
+      Enumerable curves map characters to points by index and write one character
+      per ciphertext point. Larger curves use Koblitz encoding and write every
+      ciphertext point as the hex of its compressed form.
+      """
+      # By the Hasse bound the curve has at least p + 1 - 2 * sqrt(p) points
+      return self.p + 1 - 2 * (math.isqrt(self.p) + 1) <= self.TABLE_MAX_POINTS
+
+  def _build_points(self):
+      """Enumerate (or load from the cache) the curve points and intern the base point."""
+      if not self.is_enumerable():
+          raise ValueError(
+              f"Curve over p={self.p} is too large to enumerate its points "
+              f"(character mappings and group tables need at most {self.TABLE_MAX_POINTS}).")
+
+      cached = self._load_cache()
+      if "points" in cached:
+          self._set_points(cached["points"])
+      else:
+          points = self.get_all_points()
+          self._save_cache(points=self._points_array(points))
+          self._set_points(points)
+
+  @staticmethod
+  def _points_array(points):
+      """The finite points of ``valid_points`` as an (n - 1, 2) array of coordinates."""
+      return np.array([(P.x, P.y) for P in points[1:]], dtype=np.int64)
+
+  def _set_points(self, points):
+      """Install a point list, or an array from ``_points_array``, and intern the base point."""
+      if isinstance(points, np.ndarray):
+          coordinates = points
+          points = [Point(index=0)]
+          points.extend(Point(int(x), int(y), i)
+                        for i, (x, y) in enumerate(coordinates, start=1))
+      self._valid_points = points
+      self._point_index = {point: point.index for point in points}
+      self.base_point = self.intern_point(self.base_point)
+
+  def _cache_path(self):
+      """Path of the on-disk cache for this curve, or None when caching is off."""
+      if self.cache_dir is None:
+          return None
+      return os.path.join(self.cache_dir, f"ecc_{self.a}_{self.b}_{self.p}.npz")
+
+  def _load_cache(self):
+      """Load the cached arrays for this curve, or an empty dict if there is no readable cache."""
+      path = self._cache_path()
+      if path is None or not os.path.exists(path):
+          return {}
+      try:
+          with np.load(path) as data:
+              return {name: data[name] for name in data.files}
+      except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+          # A damaged cache is rebuilt like a missing one
+          return {}
+
+  def _save_cache(self, **arrays):
+      """Merge the given arrays into the on-disk cache for this curve."""
+      path = self._cache_path()
+      if path is None:
+          return
+      os.makedirs(self.cache_dir, exist_ok=True)
+      cached = self._load_cache()
+      cached.update(arrays)
+      # Write a temporary file next to the cache and swap it in, so concurrent
+      # readers see either the old or the new cache, never a partial one
+      fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".npz.tmp")
+      try:
+          with os.fdopen(fd, "wb") as tmp_file:
+              np.savez(tmp_file, **cached)
+          os.replace(tmp_path, path)
+      except BaseException:
+          os.remove(tmp_path)
+          raise
 
   def elliptic_curve_equation(self, x):
     return (x**3 + self.a*x + self.b) % self.p
@@ -57,19 +306,63 @@ class EllipticCurveElGamal:
   def generate_random_valid_point(self):
         """Generate a random point that lies on the elliptic curve."""
         while True:
-            x = random.randint(0, self.p - 1)  # Random x-coordinate
+            x = self.random_source.scalar(0, self.p - 1)  # Random x-coordinate
             y_squared = (x**3 + self.a * x + self.b) % self.p  # Compute y^2
 
             # Check if y_squared is a quadratic residue modulo p
             if pow(y_squared, (self.p - 1) // 2, self.p) == 1:
-                # Find a valid y-coordinate
-                for y in range(self.p):
-                    if (y**2) % self.p == y_squared:
-                        return Point(x, y)
+                return Point(x, self.calc_square_root(y_squared))
+
+  def calc_square_root(self, n):
+      """
+      Calculate a modular square root of n with the Tonelli-Shanks algorithm.
+
+      Args:
+          n (int): The value to take the square root of.
+
+      Returns:
+          int: The smaller of the two roots y with y^2 = n (mod p), or None if n
+              is not a quadratic residue modulo p.
+      """
+      p = self.p
+      n %= p
+      if n == 0:
+          return 0
+      if pow(n, (p - 1) // 2, p) != 1:
+          return None
+
+      if p % 4 == 3:
+          y = pow(n, (p + 1) // 4, p)
+      else:
+          # Write p - 1 = q * 2^s with q odd and find a quadratic non-residue z
+          q, s = p - 1, 0
+          while q % 2 == 0:
+              q //= 2
+              s += 1
+          z = 2
+          while pow(z, (p - 1) // 2, p) != p - 1:
+              z += 1
+
+          m, c, t, y = s, pow(z, q, p), pow(n, q, p), pow(n, (q + 1) // 2, p)
+          while t != 1:
+              # Find the least i with t^(2^i) = 1
+              i, t2 = 0, t
+              while t2 != 1:
+                  t2 = t2 * t2 % p
+                  i += 1
+              b = pow(c, 1 << (m - i - 1), p)
+              m, c = i, b * b % p
+              t, y = t * c % p, y * b % p
+
+      return min(y, p - y)
 
   def calc_point_add(self, P, Q):
     """Calculate the addition of two points P and Q on the elliptic curve."""
-    R = Point()  # Initialize the result point R
+    if self.add_table is not None:
+        i = self.index_of(P)
+        j = self.index_of(Q)
+        if i is not None and j is not None:
+            return self.valid_points[self.add_table[i, j]]
 
     if P.is_infinity():
         return Q
@@ -89,17 +382,15 @@ class EllipticCurveElGamal:
         slope = (Q.y - P.y) * pow(Q.x - P.x, -1, self.p) % self.p
 
     # Calculate Rx
-    R.x = (slope**2 - P.x - Q.x) % self.p
+    x = (slope**2 - P.x - Q.x) % self.p
 
     # Calculate Ry
-    R.y = (slope * (P.x - R.x) - P.y) % self.p
+    y = (slope * (P.x - x) - P.y) % self.p
 
-    return R
+    return Point(x, y)
 
   def calc_point_doubling(self, P):
       """Calculate the point doubling 2P = P + P on the elliptic curve."""
-      R = Point()  # Initialize the result point R
-
       if P.is_infinity() or P.y == 0:
           # Point at infinity for vertical tangent or zero y-coordinate
           return Point()
@@ -108,12 +399,12 @@ class EllipticCurveElGamal:
       slope = (3 * P.x**2 + self.a) * pow(2 * P.y, -1, self.p) % self.p
 
       # Calculate Rx
-      R.x = (slope**2 - 2 * P.x) % self.p
+      x = (slope**2 - 2 * P.x) % self.p
 
       # Calculate Ry
-      R.y = (slope * (P.x - R.x) - P.y) % self.p
+      y = (slope * (P.x - x) - P.y) % self.p
 
-      return R
+      return Point(x, y)
 
   def calc_point_subtraction(self, P, Q):
     """Calculate the subtraction of two points P - Q on the elliptic curve."""
@@ -135,6 +426,11 @@ class EllipticCurveElGamal:
 
   def calc_point_multiplication(self, P, k):
     """Calculate kP using the double-and-add method."""
+    if self.mul_table is not None and k > 0:
+        i = self.index_of(P)
+        if i is not None:
+            return self.valid_points[self.mul_table[i, k % len(self.valid_points)]]
+
     R = Point()  # Start with the point at infinity
     current_point = P
 
@@ -148,17 +444,211 @@ class EllipticCurveElGamal:
 
     return R
 
+  def scalar_multiply(self, P, k):
+      """
+      Calculate kP, the fast way.
+
+      Uses the group tables when they are built, and otherwise a width-w NAF
+      multiplication in Jacobian coordinates (X, Y, Z) ~ (X / Z^2, Y / Z^3) that
+      needs a single modular inversion at the end. ``calc_point_multiplication``
+      is the reference implementation.
+
+      Args:
+          P (Point): The point to multiply.
+          k (int): The scalar.
+
+      Returns:
+          Point: The point kP.
+      """
+      if k <= 0 or P.is_infinity():
+          return Point()
+      if self.mul_table is not None:
+          i = self.index_of(P)
+          if i is not None:
+              return self.valid_points[self.mul_table[i, k % len(self.valid_points)]]
+
+      # Odd multiples P, 3P, ..., (2^(w-1) - 1)P
+      w = self.WNAF_WIDTH
+      base = (P.x, P.y, 1)
+      double = self._jacobian_double(base)
+      odd_multiples = [base]
+      for _ in range((1 << (w - 2)) - 1):
+          odd_multiples.append(self._jacobian_add(odd_multiples[-1], double))
+
+      R = (1, 1, 0)  # Point at infinity
+      for digit in reversed(self._wnaf(k, w)):
+          R = self._jacobian_double(R)
+          if digit > 0:
+              R = self._jacobian_add(R, odd_multiples[digit >> 1])
+          elif digit < 0:
+              X, Y, Z = odd_multiples[-digit >> 1]
+              R = self._jacobian_add(R, (X, -Y % self.p, Z))
+
+      return self._from_jacobian(R)
+
+  def multiply_base(self, k):
+      """
+      Calculate k times the base point using a fixed-base window table.
+
+      The table holds d * 2^(wj) * base_point for every window j and digit
+      1 <= d < 2^w, so kG is the sum of one table entry per non-zero window of k
+      and needs no doublings. It is built once per base point.
+
+      Args:
+          k (int): The scalar.
+
+      Returns:
+          Point: The point k * base_point.
+      """
+      if k <= 0:
+          return Point()
+      if self.mul_table is not None:
+          return self.scalar_multiply(self.base_point, k)
+      if self.order:
+          k %= self.order
+
+      if self._base_table is None or self._base_table_point != self.base_point:
+          self._build_base_table()
+      w = self.BASE_WINDOW_WIDTH
+      if k.bit_length() > w * len(self._base_table):
+          return self.scalar_multiply(self.base_point, k)
+
+      mask = (1 << w) - 1
+      R = (1, 1, 0)
+      for window in self._base_table:
+          digit = k & mask
+          if digit:
+              R = self._jacobian_add(R, window[digit])
+          k >>= w
+          if not k:
+              break
+      return self._from_jacobian(R)
+
+  def _build_base_table(self):
+      """Precompute the fixed-base window table used by ``multiply_base``."""
+      w = self.BASE_WINDOW_WIDTH
+      windows = -(-self.max_scalar().bit_length() // w)
+      G = self.base_point
+
+      table = []
+      window_base = (G.x, G.y, 1)
+      for _ in range(windows):
+          row = [(1, 1, 0), window_base]
+          for _ in range(2, 1 << w):
+              row.append(self._jacobian_add(row[-1], window_base))
+          table.append(row)
+          # 2^w times the current window base starts the next window
+          window_base = self._jacobian_add(row[-1], window_base)
+
+      # Normalize every entry to Z = 1 with a single inversion
+      flat = self._normalize_jacobian([P for row in table for P in row])
+      size = 1 << w
+      self._base_table = [flat[i:i + size] for i in range(0, len(flat), size)]
+      self._base_table_point = G
+
+  def _normalize_jacobian(self, points):
+      """Convert Jacobian points to Z = 1 form using one shared inversion (Montgomery's trick)."""
+      p = self.p
+      prefix = []
+      acc = 1
+      for X, Y, Z in points:
+          prefix.append(acc)
+          if Z:
+              acc = acc * Z % p
+      inv = pow(acc, -1, p)
+
+      normalized = [None] * len(points)
+      for i in range(len(points) - 1, -1, -1):
+          X, Y, Z = points[i]
+          if not Z:
+              normalized[i] = (1, 1, 0)
+              continue
+          z_inv = inv * prefix[i] % p
+          inv = inv * Z % p
+          z_inv2 = z_inv * z_inv % p
+          normalized[i] = (X * z_inv2 % p, Y * z_inv2 * z_inv % p, 1)
+      return normalized
+
+  @staticmethod
+  def _wnaf(k, w):
+      """Return the width-w NAF digits of k, least significant first."""
+      digits = []
+      while k > 0:
+          if k & 1:
+              digit = k & ((1 << w) - 1)
+              if digit >= 1 << (w - 1):
+                  digit -= 1 << w
+              k -= digit
+          else:
+              digit = 0
+          digits.append(digit)
+          k >>= 1
+      return digits
+
+  def _jacobian_double(self, P):
+      """Double a point in Jacobian coordinates."""
+      X, Y, Z = P
+      if Z == 0 or Y == 0:
+          return (1, 1, 0)
+      p = self.p
+      YY = Y * Y % p
+      S = 4 * X * YY % p
+      M = (3 * X * X + self.a * pow(Z, 4, p)) % p
+      X3 = (M * M - 2 * S) % p
+      Y3 = (M * (S - X3) - 8 * YY * YY) % p
+      Z3 = 2 * Y * Z % p
+      return (X3, Y3, Z3)
+
+  def _jacobian_add(self, P, Q):
+      """Add two points in Jacobian coordinates."""
+      X1, Y1, Z1 = P
+      X2, Y2, Z2 = Q
+      if Z1 == 0:
+          return Q
+      if Z2 == 0:
+          return P
+      p = self.p
+      Z1Z1 = Z1 * Z1 % p
+      Z2Z2 = Z2 * Z2 % p
+      U1 = X1 * Z2Z2 % p
+      U2 = X2 * Z1Z1 % p
+      S1 = Y1 * Z2 * Z2Z2 % p
+      S2 = Y2 * Z1 * Z1Z1 % p
+      if U1 == U2:
+          if S1 != S2:
+              return (1, 1, 0)  # P + (-P)
+          return self._jacobian_double(P)
+      H = (U2 - U1) % p
+      R = (S2 - S1) % p
+      HH = H * H % p
+      HHH = H * HH % p
+      V = U1 * HH % p
+      X3 = (R * R - HHH - 2 * V) % p
+      Y3 = (R * (V - X3) - S1 * HHH) % p
+      Z3 = H * Z1 * Z2 % p
+      return (X3, Y3, Z3)
+
+  def _from_jacobian(self, P):
+      """Convert a point from Jacobian to affine coordinates with one inversion."""
+      X, Y, Z = P
+      if Z == 0:
+          return self.intern_point(Point()) if self._point_index is not None else Point()
+      z_inv = pow(Z, -1, self.p)
+      z_inv2 = z_inv * z_inv % self.p
+      R = Point(X * z_inv2 % self.p, Y * z_inv2 * z_inv % self.p)
+      return self.intern_point(R) if self._point_index is not None else R
+
   def generate_keys(self):
         """Generate a private and public key pair."""
         # Private key d: Random scalar
-        private_key = random.randint(1, self.p - 1)
+        private_key = self.random_source.scalar(1, self.max_scalar())
 
         # Public key e2 = d * e1 (base point)
-        public_key = self.calc_point_multiplication(self.base_point, private_key)
+        public_key = self.multiply_base(private_key)
 
         return private_key, public_key
 
-  def encrypt(self, plaintext_point, public_key, k=None):
+  def encrypt(self, plaintext_point, public_key, k=None, pool=None):
       """
       Encrypt a point on the elliptic curve using the public key.
 
@@ -166,19 +656,28 @@ class EllipticCurveElGamal:
           plaintext_point (Point): The plaintext point to encrypt.
           public_key (Point): The public key.
           k (int, optional): The ephemeral key for deterministic testing. If None, a random k is used.
+          pool (EphemeralKeyPool, optional): Pool of precomputed ephemeral key pairs for
+              ``public_key``, used when k is None.
 
       Returns:
           tuple: A tuple containing the cipher points (C1, C2).
       """
+      if k is None and pool is not None:
+          if pool.public_key != public_key:
+              raise ValueError("The ephemeral key pool belongs to a different public key.")
+          # C1 = k * e1 and k * e2 come precomputed
+          k, C1, k_e2 = pool.get()
+          return C1, self.calc_point_add(plaintext_point, k_e2)
+
       # Generate a random ephemeral key k if not provided
       if k is None:
-          k = random.randint(1, self.p - 1)
+          k = self.random_source.scalar(1, self.max_scalar())
 
       # Calculate C1 = k * e1 (base point)
-      C1 = self.calc_point_multiplication(self.base_point, k)
+      C1 = self.multiply_base(k)
 
       # Calculate k * e2 (public key)
-      k_e2 = self.calc_point_multiplication(public_key, k)
+      k_e2 = self.scalar_multiply(public_key, k)
 
       # Calculate C2 = P + k * e2
       C2 = self.calc_point_add(plaintext_point, k_e2)
@@ -199,28 +698,121 @@ class EllipticCurveElGamal:
             Point: The plaintext point (P).
         """
         # Calculate d * C1
-        d_C1 = self.calc_point_multiplication(C1, private_key)
+        d_C1 = self.scalar_multiply(C1, private_key)
 
         # Subtract d * C1 from C2 to get the plaintext point
         plaintext_point = self.calc_point_subtraction(C2, d_C1)
 
         return plaintext_point
 
+  def ephemeral_key_pool(self, public_key, size=256):
+      """
+      Start a background pool of precomputed ephemeral key pairs for a public key.
+
+      Args:
+          public_key (Point): The public key to precompute pairs for.
+          size (int): Maximum number of precomputed pairs kept in the pool.
+
+      Returns:
+          EphemeralKeyPool: The running pool; pass it to ``encrypt`` or
+              ``encrypt_message`` and close it when done.
+      """
+      return EphemeralKeyPool(self, public_key, size=size)
+
+  def decryption_session(self, private_key, cache_size=256):
+      """
+      Create a decryption session that caches d * C1 for one private key.
+
+      Args:
+          private_key (int): The private key (d).
+          cache_size (int): Maximum number of d * C1 results kept in the LRU cache.
+
+      Returns:
+          DecryptionSession: The session bound to this curve and key.
+      """
+      return DecryptionSession(self, private_key, cache_size=cache_size)
+
   def get_all_points(self):
       """
       Generate all valid points on the elliptic curve.
 
       Returns:
           list: A list of all valid points on the elliptic curve, including the point at infinity.
+              Each point is interned with its position in the list as ``index``.
       """
-      points = [Point()]  # Start with the point at infinity
+      points = [Point(index=0)]  # Start with the point at infinity
       for x in range(self.p):
-          y_squared = self.elliptic_curve_equation(x)
-          for y in range(self.p):
-              if (y**2) % self.p == y_squared:
-                  points.append(Point(x, y))
+          y = self.calc_square_root(self.elliptic_curve_equation(x))
+          if y is None:
+              continue
+          points.append(Point(x, y, len(points)))
+          if y != 0:
+              points.append(Point(x, self.p - y, len(points)))
       return points
 
+  def index_of(self, point):
+      """Return the index of a point in ``valid_points``, or None if it is not a curve point."""
+      index = point.index
+      if index is not None and self.valid_points[index] is point:
+          return index
+      return self.point_index.get(point)
+
+  def intern_point(self, point):
+      """Return the shared ``valid_points`` instance equal to the given point."""
+      index = self.index_of(point)
+      return point if index is None else self.valid_points[index]
+
+  def build_group_tables(self):
+      """
+      Precompute the group tables of the curve as integer-indexed NumPy arrays.
+
+      Points are identified by their position in ``valid_points``. After this call
+      ``add_table[i, j]`` is the index of ``P_i + P_j``, ``mul_table[i, k]`` the index
+      of ``k * P_i`` for ``0 <= k < n`` and ``neg_table[i]`` the index of ``-P_i``,
+      where n is the number of points on the curve (the group order). The tables
+      are reloaded from ``cache_dir`` when they were persisted before.
+
+      Raises:
+          ValueError: If the group is too large for tables.
+      """
+      points = self.valid_points
+      n = len(points)
+      if n > self.TABLE_MAX_POINTS:
+          raise ValueError(
+              f"Group of {n} points is too large for lookup tables (max {self.TABLE_MAX_POINTS}).")
+
+      cached = self._load_cache()
+      if "add_table" in cached:
+          self.add_table = cached["add_table"]
+          self.mul_table = cached["mul_table"]
+          self.neg_table = cached["neg_table"]
+          return
+
+      # Build with the plain arithmetic; the lookup paths stay off until we are done
+      self.add_table = self.mul_table = None
+      point_index = self.point_index
+      dtype = np.min_scalar_type(n - 1)
+
+      add_table = np.empty((n, n), dtype=dtype)
+      for i, P in enumerate(points):
+          for j in range(i, n):
+              add_table[i, j] = add_table[j, i] = point_index[self.calc_point_add(P, points[j])]
+
+      # k * P_i = (k - 1) * P_i + P_i, starting from the point at infinity
+      mul_table = np.empty((n, n), dtype=dtype)
+      mul_table[:, 0] = point_index[Point()]
+      column = np.arange(n)
+      for k in range(1, n):
+          mul_table[:, k] = add_table[mul_table[:, k - 1], column]
+
+      neg_table = np.array(
+          [point_index[self.calc_point_subtraction(Point(), P)] for P in points], dtype=dtype)
+
+      self.add_table = add_table
+      self.mul_table = mul_table
+      self.neg_table = neg_table
+      self._save_cache(add_table=add_table, mul_table=mul_table, neg_table=neg_table)
+
   def create_mappings(self):
     valid_points = [point for point in self.valid_points]
     # print(f"Valid Points: {len(valid_points)}, Characters: {len(self.characters)}")
@@ -232,24 +824,85 @@ class EllipticCurveElGamal:
 
 
   def encode_character(self, char):
-        """Encode a character to a point on the elliptic curve."""
-        if char not in self.char_to_point:
+        """
+        Encode a character to a point on the elliptic curve.
+
+        Enumerable curves use the character mapping; larger curves encode any
+        character with Koblitz's method (see ``KOBLITZ_K``).
+        """
+        if not self.is_enumerable():
+            K = self.KOBLITZ_K
+            # Every candidate x must be a field element, or decoding would not invert it
+            if (ord(char) + 1) * K > self.p:
+                raise ValueError(
+                    f"Character '{char}' is too large for Koblitz encoding over p={self.p}.")
+            for x in range(ord(char) * K, ord(char) * K + K):
+                y = self.calc_square_root(self.elliptic_curve_equation(x))
+                if y is not None:
+                    return Point(x, y)
+            raise ValueError(f"Character '{char}' has no Koblitz point on this curve.")
+        point = self.char_to_point.get(char)
+        if point is None:
             raise ValueError(f"Character '{char}' not in mapping.")
-        return self.char_to_point[char]
+        return point
 
   def decode_point(self, point):
         """Decode a point on the elliptic curve to a character."""
-        if point not in self.point_to_char:
+        if not self.is_enumerable():
+            if point.is_infinity() or point.x // self.KOBLITZ_K > 0x10FFFF:
+                raise ValueError(f"Point '{point}' does not encode a character.")
+            return chr(point.x // self.KOBLITZ_K)
+        # Interned points map straight to their character without hashing
+        index = self.index_of(point)
+        if index is None:
             raise ValueError(f"Point '{point}' not in mapping.")
-        return self.point_to_char[point]
+        return self.characters[index]
+
+  def point_text_width(self):
+      """Number of ciphertext characters per point: 1, or the hex width of a compressed point."""
+      if self.is_enumerable():
+          return 1
+      return 2 * ((self.p.bit_length() + 7) // 8 + 1)
+
+  def point_to_text(self, point):
+      """Write one ciphertext point as text (see ``is_enumerable``)."""
+      if self.is_enumerable():
+          return self.decode_point(point)
+      # The point at infinity is padded to the width of a compressed point
+      return self.point_to_bytes(point).ljust(self.point_text_width() // 2, b"\x00").hex()
+
+  def text_to_points(self, ciphertext):
+      """
+      Read the ciphertext points written by ``point_to_text``.
+
+      Args:
+          ciphertext (str): Concatenated point texts.
+
+      Returns:
+          list of Point: The points, in order.
+      """
+      if self.is_enumerable():
+          return [self.encode_character(char) for char in ciphertext]
+      width = self.point_text_width()
+      if len(ciphertext) % width:
+          raise ValueError(f"Ciphertext length is not a multiple of {width}.")
+      points = []
+      for i in range(0, len(ciphertext), width):
+          try:
+              data = bytes.fromhex(ciphertext[i:i + width])
+          except ValueError:
+              raise ValueError("Ciphertext is not hex-encoded points.") from None
+          points.append(Point() if data[0] == 0 else self.point_from_bytes(data))
+      return points
 
-  def encrypt_message(self, message, public_key):
+  def encrypt_message(self, message, public_key, pool=None):
       """
       Encrypt a message using the elliptic curve encryption scheme and return a character-based ciphertext.
 
       Args:
           message (str): The message to encrypt.
           public_key (Point): The public key to use for encryption.
+          pool (EphemeralKeyPool, optional): Pool of precomputed ephemeral key pairs.
 
       Returns:
           str: The encrypted message as a string of characters.
@@ -261,11 +914,11 @@ class EllipticCurveElGamal:
           plaintext_point = self.encode_character(char)
 
           # Encrypt the point
-          C1, C2 = self.encrypt(plaintext_point, public_key)
+          C1, C2 = self.encrypt(plaintext_point, public_key, pool=pool)
 
-          # Decode encrypted points back to characters
-          encrypted_char_C1 = self.decode_point(C1)
-          encrypted_char_C2 = self.decode_point(C2)
+          # Write the encrypted points as text
+          encrypted_char_C1 = self.point_to_text(C1)
+          encrypted_char_C2 = self.point_to_text(C2)
 
           # Append the encrypted characters to the ciphertext
           ciphertext += encrypted_char_C1 + encrypted_char_C2
@@ -287,11 +940,12 @@ class EllipticCurveElGamal:
           str: The decrypted plaintext message.
       """
       plaintext = ""
-      # Process ciphertext two characters at a time (C1 and C2)
-      for i in range(0, len(ciphertext), 2):
-          # Decode C1 and C2 back into points
-          C1 = self.encode_character(ciphertext[i])
-          C2 = self.encode_character(ciphertext[i + 1])
+      points = self.text_to_points(ciphertext)
+      if len(points) % 2:
+          raise ValueError("Ciphertext must contain an even number of points.")
+      # Process the ciphertext points two at a time (C1 and C2)
+      for i in range(0, len(points), 2):
+          C1, C2 = points[i], points[i + 1]
 
           # Decrypt the point
           decrypted_point = self.decrypt(C1, C2, private_key)
@@ -304,3 +958,500 @@ class EllipticCurveElGamal:
           #       f"decoded to character '{char}'.")
 
       return plaintext
+
+  def _require_tables(self):
+      """Build the group tables on first use of a batch operation."""
+      if self.mul_table is None:
+          self.build_group_tables()
+
+  def encode_message(self, message):
+      """
+      Encode a whole message to an array of point indices in one pass.
+
+      Args:
+          message (str): The message to encode.
+
+      Returns:
+          np.ndarray: The index of the point for every character of the message.
+      """
+      # Point i encodes character i, so the index is the character's position,
+      # which only holds when the curve has one point per character
+      self.char_to_point
+      lookup = np.full(128, -1, dtype=np.int16)
+      lookup[[ord(char) for char in self.characters]] = np.arange(len(self.characters))
+
+      try:
+          codes = np.frombuffer(message.encode("ascii"), dtype=np.uint8)
+      except UnicodeEncodeError as e:
+          raise ValueError(f"Character '{message[e.start]}' not in mapping.") from None
+
+      indices = lookup[codes]
+      unknown = np.flatnonzero(indices < 0)
+      if unknown.size:
+          raise ValueError(f"Character '{message[unknown[0]]}' not in mapping.")
+      return indices.astype(np.intp)
+
+  def decode_indices(self, indices):
+      """
+      Decode an array of point indices back to a string with a single join.
+
+      Args:
+          indices (np.ndarray): Point indices, as produced by ``encode_message``.
+
+      Returns:
+          str: The characters mapped to the points.
+      """
+      alphabet = np.frombuffer("".join(self.characters).encode("ascii"), dtype=np.uint8)
+      return alphabet[indices].tobytes().decode("ascii")
+
+  def encrypt_message_batch(self, message, public_key):
+      """
+      Vectorized ``encrypt_message``: encrypt every character of the message at once.
+
+      All ephemeral keys are drawn in one RNG call and C1/C2 are computed with
+      lookups into the group tables, which are built on first use.
+
+      Args:
+          message (str): The message to encrypt.
+          public_key (Point): The public key to use for encryption.
+
+      Returns:
+          str: The encrypted message, in the same format as ``encrypt_message``.
+      """
+      self._require_tables()
+      plaintext = self.encode_message(message)
+      n = len(self.valid_points)
+
+      k = self.random_source.scalars(1, self.max_scalar(), plaintext.size) % n
+      public_index = self.index_of(public_key)
+      if public_index is None:
+          raise ValueError(f"Point '{public_key}' not in mapping.")
+
+      C1 = self.mul_table[self.index_of(self.base_point), k]
+      k_e2 = self.mul_table[public_index, k]
+      C2 = self.add_table[plaintext, k_e2]
+
+      return self.decode_indices(np.column_stack((C1, C2)).ravel())
+
+  def decrypt_message_batch(self, ciphertext, private_key):
+      """
+      Vectorized ``decrypt_message``: decrypt every (C1, C2) pair at once.
+
+      Args:
+          ciphertext (str): The encrypted message as a string of characters.
+          private_key (int): The private key for decryption.
+
+      Returns:
+          str: The decrypted plaintext message.
+      """
+      self._require_tables()
+      if len(ciphertext) % 2:
+          raise ValueError("Ciphertext must contain an even number of characters.")
+      pairs = self.encode_message(ciphertext).reshape(-1, 2)
+      n = len(self.valid_points)
+
+      d_C1 = self.mul_table[pairs[:, 0], private_key % n]
+      plaintext = self.add_table[pairs[:, 1], self.neg_table[d_C1]]
+
+      return self.decode_indices(plaintext)
+
+  def encrypt_message_multi(self, message, public_keys):
+      """
+      Encrypt a message for several recipients sharing one ephemeral key per character.
+
+      Each character gets one k and one C1 = k * base_point, and one
+      C2_i = P + k * public_key_i per recipient, so the ciphertext stores C1 once:
+      ``C1 C2_1 ... C2_N`` per character.
+
+      Args:
+          message (str): The message to encrypt.
+          public_keys (list of Point): The public keys of the recipients.
+
+      Returns:
+          str: The encrypted message, N + 1 characters per plaintext character.
+      """
+      if not public_keys:
+          raise ValueError("At least one public key is required.")
+
+      if self.mul_table is not None:
+          plaintext = self.encode_message(message)
+          n = len(self.valid_points)
+          public_indices = [self.index_of(public_key) for public_key in public_keys]
+          if None in public_indices:
+              raise ValueError("Public key not in mapping.")
+
+          k = self.random_source.scalars(1, self.max_scalar(), plaintext.size) % n
+          columns = [self.mul_table[self.index_of(self.base_point), k]]
+          for public_index in public_indices:
+              columns.append(self.add_table[plaintext, self.mul_table[public_index, k]])
+          return self.decode_indices(np.column_stack(columns).ravel())
+
+      ciphertext = []
+      for char in message:
+          plaintext_point = self.encode_character(char)
+          k = self.random_source.scalar(1, self.max_scalar())
+          ciphertext.append(self.point_to_text(self.multiply_base(k)))
+          for public_key in public_keys:
+              k_e2 = self.scalar_multiply(public_key, k)
+              ciphertext.append(self.point_to_text(self.calc_point_add(plaintext_point, k_e2)))
+      return "".join(ciphertext)
+
+  def decrypt_message_multi(self, ciphertext, private_key, recipient, recipient_count):
+      """
+      Decrypt one recipient's copy of a message from ``encrypt_message_multi``.
+
+      Args:
+          ciphertext (str): The multi-recipient ciphertext.
+          private_key (int): The private key of the recipient.
+          recipient (int): Position of the recipient's public key in ``public_keys``.
+          recipient_count (int): Number of public keys the message was encrypted for.
+
+      Returns:
+          str: The decrypted plaintext message.
+      """
+      if not 0 <= recipient < recipient_count:
+          raise ValueError(f"recipient must be between 0 and {recipient_count - 1}.")
+      width = self.point_text_width()
+      stride = (recipient_count + 1) * width
+      if len(ciphertext) % stride:
+          raise ValueError(f"Ciphertext length is not a multiple of {stride}.")
+
+      # Keep only the (C1, C2_recipient) pairs
+      offset = (1 + recipient) * width
+      pairs = "".join(ciphertext[i:i + width] + ciphertext[i + offset:i + offset + width]
+                      for i in range(0, len(ciphertext), stride))
+      if self.mul_table is not None:
+          return self.decrypt_message_batch(pairs, private_key)
+      return self.decryption_session(private_key).decrypt_message(pairs)
+
+  def index_bits(self):
+      """Return the number of bits needed to store one point index."""
+      return (len(self.valid_points) - 1).bit_length()
+
+  def pack_indices(self, indices):
+      """
+      Pack point indices into ``index_bits``-wide big-endian bit fields.
+
+      Args:
+          indices (np.ndarray): Point indices.
+
+      Returns:
+          bytes: The packed fields, zero-padded to a whole byte.
+      """
+      bits = self.index_bits()
+      fields = np.unpackbits(np.asarray(indices, dtype=">u2").view(np.uint8).reshape(-1, 2), axis=1)
+      return np.packbits(fields[:, 16 - bits:]).tobytes()
+
+  def unpack_indices(self, data, count):
+      """
+      Unpack ``count`` point indices written by ``pack_indices``.
+
+      Args:
+          data (bytes): The packed fields.
+          count (int): Number of indices to read.
+
+      Returns:
+          np.ndarray: The point indices.
+      """
+      bits = self.index_bits()
+      fields = np.unpackbits(np.frombuffer(data, dtype=np.uint8))[:count * bits]
+      weights = 1 << np.arange(bits - 1, -1, -1)
+      return fields.reshape(count, bits) @ weights
+
+  def encrypt_message_packed(self, message, public_key):
+      """
+      Encrypt a message into a binary ciphertext of packed point indices.
+
+      Each (C1, C2) pair is stored as two ``index_bits``-wide fields (6 bits each on
+      the 64-point curve) instead of two 8-bit characters.
+
+      Args:
+          message (str): The message to encrypt.
+          public_key (Point): The public key to use for encryption.
+
+      Returns:
+          bytes: The packed ciphertext.
+      """
+      ciphertext = self.encrypt_message_batch(message, public_key)
+      return self.pack_indices(self.encode_message(ciphertext))
+
+  def decrypt_message_packed(self, data, private_key):
+      """
+      Decrypt a binary ciphertext from ``encrypt_message_packed``.
+
+      Args:
+          data (bytes): The packed ciphertext.
+          private_key (int): The private key for decryption.
+
+      Returns:
+          str: The decrypted plaintext message.
+      """
+      # Padding is shorter than one pair, so the pair count follows from the length
+      pairs = len(data) * 8 // (2 * self.index_bits())
+      ciphertext = self.decode_indices(self.unpack_indices(data, 2 * pairs))
+      return self.decrypt_message_batch(ciphertext, private_key)
+
+  def point_to_bytes(self, point):
+      """
+      Encode a point in compressed form: a parity prefix followed by x.
+
+      Args:
+          point (Point): The point to encode.
+
+      Returns:
+          bytes: 0x02 or 0x03 (even or odd y) and the big-endian x-coordinate, or a
+              single 0x00 byte for the point at infinity.
+      """
+      if point.is_infinity():
+          return b"\x00"
+      size = (self.p.bit_length() + 7) // 8
+      return bytes([2 + (point.y & 1)]) + point.x.to_bytes(size, "big")
+
+  def point_from_bytes(self, data):
+      """
+      Decode a compressed point written by ``point_to_bytes``.
+
+      Args:
+          data (bytes): The encoded point.
+
+      Returns:
+          Point: The decoded point.
+      """
+      if data == b"\x00":
+          return Point()
+      size = (self.p.bit_length() + 7) // 8
+      if len(data) != size + 1 or data[0] not in (2, 3):
+          raise ValueError("Invalid compressed point encoding.")
+      x = int.from_bytes(data[1:], "big")
+      y = self.calc_square_root(self.elliptic_curve_equation(x))
+      if x >= self.p or y is None:
+          raise ValueError("Compressed point is not on the curve.")
+      if (y & 1) != data[0] - 2:
+          y = self.p - y
+      return Point(x, y)
+
+  def _encrypt_chunk(self, chunk, public_key):
+      """Encrypt one chunk with the fastest available message path."""
+      if self.mul_table is not None:
+          return self.encrypt_message_batch(chunk, public_key)
+      return self.encrypt_message(chunk, public_key)
+
+  def _decrypt_chunk(self, chunk, private_key):
+      """Decrypt one chunk with the fastest available message path."""
+      if self.mul_table is not None:
+          return self.decrypt_message_batch(chunk, private_key)
+      return self.decrypt_message(chunk, private_key)
+
+  def encrypt_stream(self, chunks, public_key):
+      """
+      Encrypt an iterable of message chunks, yielding ciphertext chunks.
+
+      Args:
+          chunks (iterable of str): The message, in pieces of any size.
+          public_key (Point): The public key to use for encryption.
+
+      Yields:
+          str: The ciphertext of each chunk, in order.
+      """
+      for chunk in chunks:
+          if chunk:
+              yield self._encrypt_chunk(chunk, public_key)
+
+  def decrypt_stream(self, chunks, private_key):
+      """
+      Decrypt an iterable of ciphertext chunks, yielding plaintext chunks.
+
+      Chunks may split a (C1, C2) pair; the dangling characters are carried over to
+      the next chunk.
+
+      Args:
+          chunks (iterable of str): The ciphertext, in pieces of any size.
+          private_key (int): The private key for decryption.
+
+      Yields:
+          str: The decrypted plaintext, in order.
+      """
+      pair_width = 2 * self.point_text_width()
+      carry = ""
+      for chunk in chunks:
+          chunk = carry + chunk
+          end = len(chunk) - len(chunk) % pair_width
+          carry = chunk[end:]
+          if end:
+              yield self._decrypt_chunk(chunk[:end], private_key)
+      if carry:
+          raise ValueError("Ciphertext must contain an even number of points.")
+
+  @staticmethod
+  def _read_chunks(file, chunk_size):
+      """Yield chunks of at most chunk_size characters from a text file object."""
+      while True:
+          chunk = file.read(chunk_size)
+          if not chunk:
+              return
+          yield chunk
+
+  def encrypt_file(self, input_file, output_file, public_key, chunk_size=65536):
+      """
+      Encrypt a text file object into another, one chunk at a time.
+
+      Args:
+          input_file: Readable text file object with the message.
+          output_file: Writable text file object for the ciphertext.
+          public_key (Point): The public key to use for encryption.
+          chunk_size (int): Number of characters read per chunk.
+
+      Returns:
+          int: Number of ciphertext characters written.
+      """
+      written = 0
+      for ciphertext in self.encrypt_stream(self._read_chunks(input_file, chunk_size), public_key):
+          written += output_file.write(ciphertext)
+      return written
+
+  def decrypt_file(self, input_file, output_file, private_key, chunk_size=65536):
+      """
+      Decrypt a text file object into another, one chunk at a time.
+
+      Args:
+          input_file: Readable text file object with the ciphertext.
+          output_file: Writable text file object for the plaintext.
+          private_key (int): The private key for decryption.
+          chunk_size (int): Number of characters read per chunk.
+
+      Returns:
+          int: Number of plaintext characters written.
+      """
+      written = 0
+      for plaintext in self.decrypt_stream(self._read_chunks(input_file, chunk_size), private_key):
+          written += output_file.write(plaintext)
+      return written
+
+  def _process_pool(self, workers):
+      """
+      Create a process pool whose workers share this curve and base point.
+
+      The points and group tables are built (or loaded from ``cache_dir``) here, once,
+      and handed to the workers, so they neither enumerate the curve nor touch the cache.
+      """
+      base_point = (self.base_point.x, self.base_point.y)
+      points = tables = None
+      try:
+          points = self._points_array(self.valid_points)
+          self._require_tables()
+          tables = (self.add_table, self.mul_table, self.neg_table)
+      except ValueError:
+          pass  # Too large to enumerate or tabulate; workers use point arithmetic
+      return ProcessPoolExecutor(
+          max_workers=workers,
+          initializer=_init_worker,
+          initargs=(self.a, self.b, self.p, base_point, self.order, points, tables),
+      )
+
+  def encrypt_message_parallel(self, message, public_key, workers=None, shard_size=65536):
+      """
+      Encrypt a message in shards on a process pool, preserving the output order.
+
+      The curve's points and group tables are built once in this process and sent
+      to every worker, which then encrypts whole shards.
+
+      Args:
+          message (str): The message to encrypt.
+          public_key (Point): The public key to use for encryption.
+          workers (int, optional): Number of worker processes; defaults to the CPU count.
+          shard_size (int): Number of characters per shard.
+
+      Returns:
+          str: The encrypted message, in the same format as ``encrypt_message``.
+      """
+      shards = [message[i:i + shard_size] for i in range(0, len(message), shard_size)]
+      if len(shards) <= 1:
+          return self._encrypt_chunk(message, public_key)
+      public_key = Point(public_key.x, public_key.y)
+      with self._process_pool(workers) as pool:
+          return "".join(pool.map(_encrypt_shard, shards, [public_key] * len(shards)))
+
+  def decrypt_message_parallel(self, ciphertext, private_key, workers=None, shard_size=65536):
+      """
+      Decrypt a ciphertext in shards on a process pool, preserving the output order.
+
+      Args:
+          ciphertext (str): The encrypted message as a string of characters.
+          private_key (int): The private key for decryption.
+          workers (int, optional): Number of worker processes; defaults to the CPU count.
+          shard_size (int): Number of ciphertext characters per shard, rounded up to
+              keep (C1, C2) pairs together.
+
+      Returns:
+          str: The decrypted plaintext message.
+      """
+      pair_width = 2 * self.point_text_width()
+      if len(ciphertext) % pair_width:
+          raise ValueError("Ciphertext must contain an even number of points.")
+      shard_size = -(-shard_size // pair_width) * pair_width
+      shards = [ciphertext[i:i + shard_size] for i in range(0, len(ciphertext), shard_size)]
+      if len(shards) <= 1:
+          return self._decrypt_chunk(ciphertext, private_key)
+      with self._process_pool(workers) as pool:
+          return "".join(pool.map(_decrypt_shard, shards, [private_key] * len(shards)))
+
+  def _keystream(self, header, shared_point, length):
+      """Derive a keystream from the ephemeral point header and the shared point."""
+      return hashlib.shake_256(b"ECEG" + header + self.point_to_bytes(shared_point)).digest(length)
+
+  def encrypt_bytes(self, data, public_key):
+      """
+      Encrypt arbitrary bytes with one ECC key agreement and a SHAKE-256 keystream.
+
+      A single ephemeral k gives R = k * base_point, sent as a compressed point
+      header, and the shared point S = k * public_key, from which the keystream
+      is derived. The ciphertext is the header followed by the data XOR the
+      keystream, so it is only one point longer than the plaintext. There is no
+      authentication tag; tampering is not detected.
+
+      Args:
+          data (bytes or str): The data to encrypt; str is encoded as UTF-8.
+          public_key (Point): The public key to use for encryption.
+
+      Returns:
+          bytes: The header and the encrypted data.
+      """
+      if isinstance(data, str):
+          data = data.encode("utf-8")
+      if public_key.is_infinity():
+          raise ValueError("The public key must not be the point at infinity.")
+
+      # Draw again in the rare case k * public_key is the point at infinity
+      while True:
+          k = self.random_source.scalar(1, self.max_scalar())
+          shared_point = self.scalar_multiply(public_key, k)
+          if not shared_point.is_infinity():
+              break
+
+      header = self.point_to_bytes(self.multiply_base(k))
+      keystream = self._keystream(header, shared_point, len(data))
+      body = np.bitwise_xor(np.frombuffer(data, dtype=np.uint8),
+                            np.frombuffer(keystream, dtype=np.uint8))
+      return header + body.tobytes()
+
+  def decrypt_bytes(self, ciphertext, private_key):
+      """
+      Decrypt a ciphertext from ``encrypt_bytes``.
+
+      Args:
+          ciphertext (bytes): The header and the encrypted data.
+          private_key (int): The private key for decryption.
+
+      Returns:
+          bytes: The decrypted data.
+      """
+      if not ciphertext:
+          raise ValueError("Ciphertext is empty.")
+      header_size = 1 if ciphertext[0] == 0 else (self.p.bit_length() + 7) // 8 + 1
+      header, body = ciphertext[:header_size], ciphertext[header_size:]
+
+      shared_point = self.scalar_multiply(self.point_from_bytes(header), private_key)
+      keystream = self._keystream(header, shared_point, len(body))
+      plaintext = np.bitwise_xor(np.frombuffer(body, dtype=np.uint8),
+                                 np.frombuffer(keystream, dtype=np.uint8))
+      return plaintext.tobytes()
@@ -0,0 +1,379 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from EllipticCurveElGamal import (DecryptionSession, EllipticCurveElGamal, NumpyRandomSource,
+                                  Point, RandomSource, SystemRandomSource)
+
+
+class TestEllipticCurveElGamal(unittest.TestCase):
+    def setUp(self):
+        """Set up a plain and a table-driven instance sharing one base point."""
+        self.ecc = EllipticCurveElGamal()
+        self.table_ecc = EllipticCurveElGamal(use_tables=True)
+        self.table_ecc.base_point = self.table_ecc.intern_point(self.ecc.base_point)
+
+    def test_group_tables_match_arithmetic(self):
+        """Test that table lookups agree with the double-and-add arithmetic."""
+        points = self.ecc.valid_points
+        for P in points:
+            for Q in points:
+                self.assertEqual(self.table_ecc.calc_point_add(P, Q),
+                                 self.ecc.calc_point_add(P, Q))
+            for k in range(1, 2 * len(points)):
+                self.assertEqual(self.table_ecc.calc_point_multiplication(P, k),
+                                 self.ecc.calc_point_multiplication(P, k))
+
+    def test_encrypt_decrypt_with_tables(self):
+        """Test that a message round-trips through the table-driven engine."""
+        message = "hello, world! 0123456789"
+        private_key, public_key = self.table_ecc.generate_keys()
+        ciphertext = self.table_ecc.encrypt_message(message, public_key)
+
+        self.assertEqual(len(ciphertext), 2 * len(message))
+        self.assertEqual(self.table_ecc.decrypt_message(ciphertext, private_key), message)
+        self.assertEqual(self.ecc.decrypt_message(ciphertext, private_key), message)
+
+    def test_batch_encrypt_decrypt(self):
+        """Test that the vectorized batch mode interoperates with the per-character path."""
+        message = "nik: 3201234567890123, nama: budi santoso; rt/rw: 001/002"
+        private_key, public_key = self.table_ecc.generate_keys()
+
+        ciphertext = self.table_ecc.encrypt_message_batch(message, public_key)
+        self.assertEqual(len(ciphertext), 2 * len(message))
+        self.assertEqual(self.table_ecc.decrypt_message_batch(ciphertext, private_key), message)
+        self.assertEqual(self.ecc.decrypt_message(ciphertext, private_key), message)
+
+        ciphertext = self.ecc.encrypt_message(message, public_key)
+        self.assertEqual(self.table_ecc.decrypt_message_batch(ciphertext, private_key), message)
+
+    def test_batch_rejects_unknown_character(self):
+        """Test that the batch mode reports characters outside the mapping."""
+        _, public_key = self.table_ecc.generate_keys()
+        with self.assertRaises(ValueError):
+            self.table_ecc.encrypt_message_batch("Hello", public_key)
+        with self.assertRaises(ValueError):
+            self.table_ecc.encrypt_message_batch("caf\u00e9", public_key)
+        # A curve without one point per character has no index mapping
+        ecc = EllipticCurveElGamal(2, 3, 97)
+        with self.assertRaises(ValueError):
+            ecc.encrypt_message_batch("abc", ecc.base_point)
+        with self.assertRaises(ValueError):
+            ecc.decrypt_message_batch("abcd", 1)
+
+    def test_points_are_interned(self):
+        """Test that mapped points are shared instances identified by their index."""
+        for index, char in enumerate(self.ecc.characters):
+            point = self.ecc.encode_character(char)
+            self.assertIs(point, self.ecc.valid_points[index])
+            self.assertEqual(point.index, index)
+            self.assertEqual(self.ecc.decode_point(point), char)
+            # A fresh, equal point still decodes through the hash lookup
+            self.assertEqual(self.ecc.decode_point(Point(point.x, point.y)), char)
+
+        self.assertFalse(hasattr(Point(1, 2), "__dict__"))
+        self.assertIs(self.table_ecc.calc_point_add(self.table_ecc.base_point, Point()),
+                      self.table_ecc.base_point)
+
+    def test_square_root(self):
+        """Test the modular square root for both p = 3 (mod 4) and p = 1 (mod 4)."""
+        for p in (61, 67, 97):
+            self.ecc.p = p
+            residues = {(y * y) % p for y in range(p)}
+            for n in range(p):
+                root = self.ecc.calc_square_root(n)
+                if n in residues:
+                    self.assertEqual((root * root) % p, n)
+                    self.assertLessEqual(root, p - root)
+                else:
+                    self.assertIsNone(root)
+
+    def test_points_match_brute_force(self):
+        """Test that the enumerated points match the O(p^2) search in the same order."""
+        expected = [(None, None)] + [(x, y) for x in range(self.ecc.p) for y in range(self.ecc.p)
+                                     if (y * y) % self.ecc.p == self.ecc.elliptic_curve_equation(x)]
+        self.assertEqual([(P.x, P.y) for P in self.ecc.valid_points], expected)
+        self.assertTrue(self.ecc.is_on_curve(self.ecc.base_point.x, self.ecc.base_point.y))
+
+    def test_lazy_construction_and_disk_cache(self):
+        """Test that points are built lazily and reloaded from the on-disk cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ecc = EllipticCurveElGamal(cache_dir=cache_dir)
+            self.assertIsNone(ecc._valid_points)
+            ecc.build_group_tables()
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "ecc_6_7_61.npz")))
+
+            cached = EllipticCurveElGamal(use_tables=True, cache_dir=cache_dir)
+            self.assertEqual(cached.valid_points, ecc.valid_points)
+            self.assertTrue((cached.add_table == ecc.add_table).all())
+            self.assertTrue((cached.mul_table == ecc.mul_table).all())
+            self.assertEqual(os.listdir(cache_dir), ["ecc_6_7_61.npz"])
+
+            # A truncated cache is treated as missing and rewritten
+            with open(os.path.join(cache_dir, "ecc_6_7_61.npz"), "r+b") as cache_file:
+                cache_file.truncate(100)
+            rebuilt = EllipticCurveElGamal(use_tables=True, cache_dir=cache_dir)
+            self.assertEqual(rebuilt.valid_points, ecc.valid_points)
+            self.assertIn("add_table", rebuilt._load_cache())
+
+    def test_scalar_multiply_matches_reference(self):
+        """Test the Jacobian wNAF multiplication against double-and-add on the toy curve."""
+        for P in self.ecc.valid_points:
+            for k in range(0, 2 * len(self.ecc.valid_points)):
+                self.assertEqual(self.ecc.scalar_multiply(P, k),
+                                 self.ecc.calc_point_multiplication(P, k))
+
+    def test_large_prime_curves(self):
+        """Test scalar multiplication and point encryption on 256-bit standard curves."""
+        for name in EllipticCurveElGamal.CURVES:
+            ecc = EllipticCurveElGamal.from_name(name)
+            G = ecc.base_point
+            for k in (1, 2, 3, 15, 16, 17, random.randint(1, ecc.order - 1)):
+                self.assertEqual(ecc.scalar_multiply(G, k), ecc.calc_point_multiplication(G, k))
+            self.assertTrue(ecc.scalar_multiply(G, ecc.order).is_infinity())
+
+            private_key, public_key = ecc.generate_keys()
+            self.assertTrue(ecc.is_on_curve(public_key.x, public_key.y))
+            plaintext_point = ecc.scalar_multiply(G, 12345)
+            C1, C2 = ecc.encrypt(plaintext_point, public_key)
+            self.assertEqual(ecc.decrypt(C1, C2, private_key), plaintext_point)
+
+        # 2G on secp256k1
+        ecc = EllipticCurveElGamal.from_name("secp256k1")
+        self.assertEqual(ecc.scalar_multiply(ecc.base_point, 2).x,
+                         0xC6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5)
+        with self.assertRaises(ValueError):
+            EllipticCurveElGamal(base_point=(0, 0))
+
+    def test_large_curve_messages(self):
+        """Test the message-level API on a standard curve via Koblitz encoding."""
+        ecc = EllipticCurveElGamal.from_name("secp256k1")
+        self.assertFalse(ecc.is_enumerable())
+        for char in ("a", "Z", "\u00e9", "\u2603"):
+            point = ecc.encode_character(char)
+            self.assertTrue(ecc.is_on_curve(point.x, point.y))
+            self.assertEqual(ecc.decode_point(point), char)
+
+        message = "NIK: 3171, Nama: Budi \u00e9"
+        private_key, public_key = ecc.generate_keys()
+        ciphertext = ecc.encrypt_message(message, public_key)
+        self.assertEqual(len(ciphertext), 2 * len(message) * ecc.point_text_width())
+        self.assertEqual(ecc.decrypt_message(ciphertext, private_key), message)
+        self.assertEqual(ecc.decryption_session(private_key).decrypt_message(ciphertext),
+                         message)
+        self.assertEqual("".join(ecc.decrypt_stream(
+            [ciphertext[:100], ciphertext[100:]], private_key)), message)
+
+        other_private, other_public = ecc.generate_keys()
+        multi = ecc.encrypt_message_multi(message, [public_key, other_public])
+        self.assertEqual(ecc.decrypt_message_multi(multi, other_private, 1, 2), message)
+        with self.assertRaises(ValueError):
+            ecc.decrypt_message(ciphertext[:-1], private_key)
+
+        # A mid-size prime: too large to enumerate, too small for every code point
+        ecc = EllipticCurveElGamal(2, 3, 65537)
+        self.assertFalse(ecc.is_enumerable())
+        private_key, public_key = ecc.generate_keys()
+        while public_key.is_infinity():
+            private_key, public_key = ecc.generate_keys()
+        ciphertext = ecc.encrypt_message("ok \u00e9", public_key)
+        self.assertEqual(ecc.decrypt_message(ciphertext, private_key), "ok \u00e9")
+        for char in ("\u2603", "\u0400"):
+            with self.assertRaises(ValueError):
+                ecc.encode_character(char)
+        with self.assertRaises(ValueError):
+            EllipticCurveElGamal(2, 3, 2003).encode_character("a")
+
+    def test_multiply_base(self):
+        """Test the fixed-base window table against the reference multiplication."""
+        G = self.ecc.base_point
+        for k in range(0, 3 * len(self.ecc.valid_points)):
+            self.assertEqual(self.ecc.multiply_base(k), self.ecc.calc_point_multiplication(G, k))
+
+        ecc = EllipticCurveElGamal.from_name("secp256k1")
+        for k in (1, 16, 255, 256, ecc.order - 1, random.randint(1, ecc.order - 1)):
+            self.assertEqual(ecc.multiply_base(k), ecc.scalar_multiply(ecc.base_point, k))
+
+        # Changing the base point rebuilds the table
+        self.ecc.base_point = self.ecc.valid_points[5]
+        self.assertEqual(self.ecc.multiply_base(7),
+                         self.ecc.calc_point_multiplication(self.ecc.valid_points[5], 7))
+
+    def test_decryption_session(self):
+        """Test that a decryption session decrypts like decrypt_message and caches d * C1."""
+        message = "ktp: 3201-0101-9000-0001 / budi"
+        private_key, public_key = self.ecc.generate_keys()
+        ciphertexts = [self.ecc.encrypt_message(message, public_key) for _ in range(3)]
+
+        session = self.ecc.decryption_session(private_key)
+        self.assertIsNotNone(session.shared_table)
+        self.assertEqual(session.decrypt_batch(ciphertexts), [message] * 3)
+
+        # Without tables every distinct C1 is computed once and then served from the cache
+        session = DecryptionSession(EllipticCurveElGamal(), private_key, precompute=False)
+        self.assertIsNone(session.shared_table)
+        self.assertEqual(session.decrypt_batch(ciphertexts), [message] * 3)
+        info = session.cache_info()
+        self.assertLessEqual(info.misses, len(self.ecc.valid_points))
+        self.assertEqual(info.hits + info.misses, 3 * len(message))
+
+    def test_ephemeral_key_pool(self):
+        """Test that encryption consumes precomputed pairs from the background pool."""
+        message = "pooled message"
+        private_key, public_key = self.ecc.generate_keys()
+
+        with self.ecc.ephemeral_key_pool(public_key, size=8) as pool:
+            k, C1, k_e2 = pool.get()
+            self.assertEqual(C1, self.ecc.calc_point_multiplication(self.ecc.base_point, k))
+            self.assertEqual(k_e2, self.ecc.calc_point_multiplication(public_key, k))
+
+            ciphertext = self.ecc.encrypt_message(message, public_key, pool=pool)
+            self.assertEqual(self.ecc.decrypt_message(ciphertext, private_key), message)
+
+            with self.assertRaises(ValueError):
+                other_key = self.ecc.calc_point_add(public_key, self.ecc.base_point)
+                self.ecc.encrypt(C1, other_key, pool=pool)
+
+    def test_multi_recipient(self):
+        """Test that every recipient decrypts a message encrypted once for all of them."""
+        message = "shared ktp payload"
+        keys = [self.ecc.generate_keys() for _ in range(3)]
+        public_keys = [public_key for _, public_key in keys]
+
+        for ecc in (self.ecc, self.table_ecc):
+            ciphertext = ecc.encrypt_message_multi(message, public_keys)
+            self.assertEqual(len(ciphertext), (len(public_keys) + 1) * len(message))
+            for recipient, (private_key, _) in enumerate(keys):
+                self.assertEqual(
+                    ecc.decrypt_message_multi(ciphertext, private_key, recipient, len(keys)),
+                    message)
+
+    def test_packed_ciphertext(self):
+        """Test the 6-bit packed binary ciphertext format."""
+        private_key, public_key = self.table_ecc.generate_keys()
+        for message in ("", "a", "ab", "abc", "packed ktp payload, 12345"):
+            data = self.table_ecc.encrypt_message_packed(message, public_key)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(len(data), (12 * len(message) + 7) // 8)
+            self.assertEqual(self.table_ecc.decrypt_message_packed(data, private_key), message)
+
+    def test_point_compression(self):
+        """Test that compressed points decode back to the same point."""
+        for P in self.ecc.valid_points:
+            self.assertEqual(self.ecc.point_from_bytes(self.ecc.point_to_bytes(P)), P)
+
+        ecc = EllipticCurveElGamal.from_name("P-256")
+        P = ecc.multiply_base(random.randint(1, ecc.order - 1))
+        data = ecc.point_to_bytes(P)
+        self.assertEqual(len(data), 33)
+        self.assertEqual(ecc.point_from_bytes(data), P)
+
+    def test_streaming_encrypt_decrypt(self):
+        """Test chunked encryption and decryption, including pairs split across chunks."""
+        message = "streamed ktp dump; " * 50
+        private_key, public_key = self.table_ecc.generate_keys()
+
+        ciphertext = io.StringIO()
+        self.table_ecc.encrypt_file(io.StringIO(message), ciphertext, public_key, chunk_size=7)
+        self.assertEqual(len(ciphertext.getvalue()), 2 * len(message))
+
+        plaintext = io.StringIO()
+        ciphertext.seek(0)
+        self.table_ecc.decrypt_file(ciphertext, plaintext, private_key, chunk_size=13)
+        self.assertEqual(plaintext.getvalue(), message)
+
+        pieces = [ciphertext.getvalue()[i:i + 3] for i in range(0, 60, 3)]
+        self.assertEqual("".join(self.ecc.decrypt_stream(pieces, private_key)), message[:30])
+        with self.assertRaises(ValueError):
+            list(self.ecc.decrypt_stream(["abc"], private_key))
+
+    def test_parallel_encrypt_decrypt(self):
+        """Test that sharded process-pool encryption keeps the output order."""
+        message = "".join(self.ecc.characters) * 20
+        private_key, public_key = self.ecc.generate_keys()
+
+        ciphertext = self.ecc.encrypt_message_parallel(message, public_key, workers=2,
+                                                       shard_size=100)
+        self.assertEqual(len(ciphertext), 2 * len(message))
+        self.assertEqual(self.ecc.decrypt_message(ciphertext, private_key), message)
+        self.assertEqual(
+            self.ecc.decrypt_message_parallel(ciphertext, private_key, workers=2, shard_size=99),
+            message)
+
+    def test_parallel_with_cache_dir(self):
+        """Test that parallel workers with an empty cache_dir neither race nor crash."""
+        message = "".join(self.ecc.characters) * 8
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ecc = EllipticCurveElGamal(base_point=self.ecc.base_point, cache_dir=cache_dir)
+            private_key, public_key = ecc.generate_keys()
+            ciphertext = ecc.encrypt_message_parallel(message, public_key, workers=4,
+                                                      shard_size=64)
+            self.assertEqual(
+                ecc.decrypt_message_parallel(ciphertext, private_key, workers=4, shard_size=64),
+                message)
+            self.assertEqual(os.listdir(cache_dir), ["ecc_6_7_61.npz"])
+
+    def test_hybrid_bytes_mode(self):
+        """Test the hybrid mode on arbitrary bytes and full KTP text."""
+        record = "NIK: 3201010101900001\nNama: BUDI SANTOSO\nAlamat: Jl. Merdeka No. 1"
+        for ecc in (self.ecc, EllipticCurveElGamal.from_name("secp256k1")):
+            private_key, public_key = ecc.generate_keys()
+            while public_key.is_infinity():
+                private_key, public_key = ecc.generate_keys()
+            header_size = (ecc.p.bit_length() + 7) // 8 + 1
+
+            ciphertext = ecc.encrypt_bytes(record, public_key)
+            self.assertEqual(len(ciphertext), header_size + len(record.encode("utf-8")))
+            self.assertEqual(ecc.decrypt_bytes(ciphertext, private_key).decode("utf-8"), record)
+
+            data = bytes(range(256)) * 4
+            self.assertEqual(ecc.decrypt_bytes(ecc.encrypt_bytes(data, public_key), private_key),
+                             data)
+            self.assertEqual(ecc.decrypt_bytes(ecc.encrypt_bytes(b"", public_key), private_key),
+                             b"")
+
+    def test_random_sources(self):
+        """Test bulk rejection sampling and seeded, reproducible encryption."""
+        for source in (SystemRandomSource(), NumpyRandomSource(7)):
+            values = source.scalars(1, 60, 5000)
+            self.assertEqual(len(values), 5000)
+            self.assertEqual(set(values.tolist()), set(range(1, 61)))
+
+            big = 2**255
+            values = source.scalars(big, 2 * big, 10)
+            self.assertTrue(all(big <= value <= 2 * big for value in values))
+            self.assertEqual(source.scalar(5, 5), 5)
+
+        message = "deterministic benchmark"
+        ciphertexts = []
+        for _ in range(2):
+            ecc = EllipticCurveElGamal(use_tables=True, random_source=NumpyRandomSource(42))
+            private_key, public_key = ecc.generate_keys()
+            ciphertexts.append(ecc.encrypt_message_batch(message, public_key))
+            self.assertEqual(ecc.decrypt_message_batch(ciphertexts[-1], private_key), message)
+        self.assertEqual(ciphertexts[0], ciphertexts[1])
+        with self.assertRaises(TypeError):
+            RandomSource()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_system_random_source_after_fork(self):
+        """Test that a forked child does not reuse the parent's buffered random bytes."""
+        source = SystemRandomSource()
+        source.scalar(1, 2**64)  # Fill the buffer
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, source._take(32))
+            os._exit(0)
+        os.close(write_fd)
+        child_bytes = os.read(read_fd, 32)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(len(child_bytes), 32)
+        self.assertNotEqual(child_bytes, source._take(32))
+
+
+if __name__ == "__main__":
+    unittest.main()
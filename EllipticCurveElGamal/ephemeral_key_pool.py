@@ -0,0 +1,70 @@
+import queue
+import threading
+
+
+class EphemeralKeyPool:
+    def __init__(self, ecc, public_key, size=256):
+        """
+        Initialize a pool of precomputed ephemeral key pairs for one public key.
+
+        A background thread keeps a bounded queue filled with (k, k * base_point,
+        k * public_key) so encryption does not pay for the scalar multiplications.
+
+        Args:
+            ecc (EllipticCurveElGamal): The curve to encrypt on.
+            public_key (Point): The public key the pairs are computed for.
+            size (int): Maximum number of precomputed pairs kept in the pool.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.ecc = ecc
+        self.public_key = public_key
+        self._pairs = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._fill, name="EphemeralKeyPool", daemon=True)
+        self._worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _compute_pair(self):
+        k = self.ecc.random_source.scalar(1, self.ecc.max_scalar())
+        return k, self.ecc.multiply_base(k), self.ecc.scalar_multiply(self.public_key, k)
+
+    def _fill(self):
+        """Keep the queue topped up until the pool is closed."""
+        pair = None
+        while not self._stop.is_set():
+            if pair is None:
+                pair = self._compute_pair()
+            try:
+                self._pairs.put(pair, timeout=0.1)
+                pair = None
+            except queue.Full:
+                pass
+
+    def get(self):
+        """
+        Take one precomputed ephemeral key pair.
+
+        Falls back to computing the pair inline when the pool is empty.
+
+        Returns:
+            tuple: (k, k * base_point, k * public_key).
+        """
+        try:
+            return self._pairs.get_nowait()
+        except queue.Empty:
+            return self._compute_pair()
+
+    def qsize(self):
+        """Return the number of precomputed pairs currently available."""
+        return self._pairs.qsize()
+
+    def close(self):
+        """Stop the background thread."""
+        self._stop.set()
+        self._worker.join()
@@ -0,0 +1,114 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+import weakref
+import numpy as np
+
+# Live buffered sources. A forked child inherits their buffers, so it would hand out
+# the same bytes (for ElGamal, the same ephemeral keys) as its parent; the buffers
+# are dropped in the child right after the fork.
+_sources = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for source in list(_sources):
+        source._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class RandomSource(ABC):
+    # Number of random bytes fetched from the underlying generator at a time.
+    BUFFER_SIZE = 4096
+
+    def __init__(self):
+        """Initialize the buffered source of random scalars."""
+        self._reset()
+        _sources.add(self)
+
+    def _reset(self):
+        """Drop the buffered bytes (and any lock state inherited from a parent process)."""
+        self._buffer = b""
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _random_bytes(self, size):
+        """Return size fresh random bytes from the underlying generator."""
+
+    def _take(self, size):
+        """Take size bytes from the buffer, refilling it in bulk when it runs low."""
+        if self._offset + size > len(self._buffer):
+            self._buffer = self._buffer[self._offset:] + self._random_bytes(
+                max(size, self.BUFFER_SIZE))
+            self._offset = 0
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return data
+
+    def scalars(self, low, high, size):
+        """
+        Draw uniformly distributed integers from [low, high] by rejection sampling.
+
+        Args:
+            low (int): The smallest value.
+            high (int): The largest value.
+            size (int): Number of values to draw.
+
+        Returns:
+            np.ndarray or list: An int64 array when the range fits in 63 bits, a list
+                of Python ints otherwise.
+        """
+        span = high - low + 1
+        if span < 1:
+            raise ValueError("high must not be smaller than low.")
+        bits = (span - 1).bit_length()
+        mask = (1 << bits) - 1
+
+        with self._lock:
+            if bits <= 63:
+                # Masked uint64 words are accepted with probability > 1/2
+                values = np.empty(0, dtype=np.uint64)
+                while values.size < size:
+                    count = 2 * (size - values.size) + 8
+                    words = np.frombuffer(self._take(8 * count), dtype="<u8") & np.uint64(mask)
+                    values = np.concatenate((values, words[words < span]))
+                return values[:size].astype(np.int64) + low
+
+            nbytes = (bits + 7) // 8
+            values = []
+            while len(values) < size:
+                value = int.from_bytes(self._take(nbytes), "big") & mask
+                if value < span:
+                    values.append(low + value)
+            return values
+
+    def scalar(self, low, high):
+        """Draw one uniformly distributed integer from [low, high]."""
+        return int(self.scalars(low, high, 1)[0])
+
+
+class SystemRandomSource(RandomSource):
+    """Cryptographically secure scalars from ``os.urandom``."""
+
+    def _random_bytes(self, size):
+        return os.urandom(size)
+
+
+class NumpyRandomSource(RandomSource):
+    def __init__(self, seed=None):
+        """
+        Initialize a reproducible source backed by a NumPy ``Generator``.
+
+        Not suitable for key material; meant for deterministic tests and benchmarks.
+
+        Args:
+            seed (int, optional): Seed of the generator.
+        """
+        super().__init__()
+        self.generator = np.random.default_rng(seed)
+
+    def _random_bytes(self, size):
+        return self.generator.bytes(size)
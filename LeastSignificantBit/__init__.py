@@ -1,3 +1,5 @@
 from .least_significant_bit import LeastSignificantBit
+from .batch_stego_runner import BatchStegoRunner
+from .image_quality_metrics import ImageQualityMetrics
 
-__all__ = ["LeastSignificantBit"]
+__all__ = ["LeastSignificantBit", "BatchStegoRunner", "ImageQualityMetrics"]
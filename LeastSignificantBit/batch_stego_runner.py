@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+import numpy as np
+from .least_significant_bit import LeastSignificantBit
+
+
+def _embed_item(item, carrier_dir, output_dir, k_val, output_format, compress_level):
+    """
+    Embed one manifest item in a worker process and report its timing.
+    """
+    result = {
+        'carrier': item['carrier'],
+        'output': None,
+        'status': 'ok',
+        'error': None,
+        'payload_bytes': len(item['payload']),
+        'seconds': 0.0,
+    }
+    start = time.perf_counter()
+    try:
+        # Decode the carrier once; everything else works on the array
+        with Image.open(os.path.join(carrier_dir, item['carrier'])) as image:
+            img_data = np.array(image)
+        lsb = LeastSignificantBit(k_val=k_val, output_format=output_format,
+                                  compress_level=compress_level)
+        lsb.embed(img_data, item['payload'], in_place=True)
+
+        output_path = os.path.join(output_dir, item['output'])
+        lsb.save_image(img_data, output_path)
+        result['output'] = output_path
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+class BatchStegoRunner:
+    def __init__(self, k_val=1, workers=None, output_format='PNG', compress_level=None):
+        """
+        Initialize a headless runner that embeds many payloads on a process pool.
+
+        Args:
+            k_val (int): The number of least significant bits to use for embedding.
+            workers (int, optional): Number of worker processes; defaults to the CPU count.
+            output_format (str): Format of the stego images: PNG, BMP, TIFF or NPY.
+                None means PNG.
+            compress_level (int, optional): PNG zlib level from 0 (fastest) to 9.
+        """
+        # Output names are built from the format, so it is always set
+        output_format = (output_format or 'PNG').upper()
+        # Validates the options before any work is scheduled
+        LeastSignificantBit(k_val, output_format=output_format, compress_level=compress_level)
+        self.k_val = k_val
+        self.workers = workers
+        self.output_format = output_format
+        self.compress_level = compress_level
+
+    @staticmethod
+    def load_manifest(manifest_path):
+        """
+        Load a JSON Lines manifest of payloads.
+
+        Every line is an object with a 'carrier' file name (relative to the carrier
+        directory), either a 'payload' string or a 'payload_file' path (relative to
+        the manifest), and an optional 'output' file name.
+        """
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+        items = []
+        with open(manifest_path, encoding='utf-8') as manifest:
+            for line_number, line in enumerate(manifest, start=1):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if 'carrier' not in entry:
+                    raise ValueError(f"Manifest line {line_number} has no 'carrier'.")
+                if 'payload_file' in entry:
+                    with open(os.path.join(base_dir, entry['payload_file']), 'rb') as payload:
+                        data = payload.read()
+                elif 'payload' in entry:
+                    data = entry['payload'].encode('utf-8')
+                else:
+                    raise ValueError(
+                        f"Manifest line {line_number} needs 'payload' or 'payload_file'.")
+                items.append({'carrier': entry['carrier'], 'payload': data,
+                              'output': entry.get('output')})
+        return items
+
+    def output_names(self, items):
+        """
+        Resolve the output file name of every manifest item.
+
+        Items without an 'output' are named after their carrier, with the item's
+        1-based manifest position appended when several items would get the same
+        name (one template carrier stamped with many payloads, or a.png and a.jpg).
+
+        Raises:
+            ValueError: If two items still write the same file.
+        """
+        extension = self.output_format.lower()
+        stems = [os.path.splitext(os.path.basename(item['carrier']))[0] for item in items]
+        default_counts = {}
+        for item, stem in zip(items, stems):
+            if not item.get('output'):
+                default_counts[stem] = default_counts.get(stem, 0) + 1
+
+        names = []
+        seen = {}
+        for position, (item, stem) in enumerate(zip(items, stems), start=1):
+            name = item.get('output')
+            if not name:
+                name = (f"{stem}.{extension}" if default_counts[stem] == 1
+                        else f"{stem}_{position}.{extension}")
+            key = os.path.normcase(os.path.normpath(name))
+            if key in seen:
+                raise ValueError(
+                    f"Manifest items {seen[key]} and {position} both write '{name}'.")
+            seen[key] = position
+            names.append(name)
+        return names
+
+    def run(self, carrier_dir, manifest_path, output_dir):
+        """
+        Embed every manifest item and report per-item timing and failures.
+
+        Returns:
+            list: One result dict per item (carrier, output, status, error,
+                payload_bytes, seconds), in manifest order.
+        """
+        items = self.load_manifest(manifest_path)
+        # Resolve every output up front so no item silently overwrites another
+        for item, name in zip(items, self.output_names(items)):
+            item['output'] = name
+        os.makedirs(output_dir, exist_ok=True)
+        args = (carrier_dir, output_dir, self.k_val, self.output_format, self.compress_level)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_embed_item, item, *args) for item in items]
+            return [future.result() for future in futures]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Embed a manifest of payloads into a directory of carrier images.")
+    parser.add_argument('carrier_dir')
+    parser.add_argument('manifest')
+    parser.add_argument('output_dir')
+    parser.add_argument('--k-val', type=int, default=1)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--format', default='PNG', help="PNG, BMP, TIFF or NPY")
+    parser.add_argument('--compress-level', type=int, default=None,
+                        help="PNG zlib level, 0 (fastest) to 9")
+    args = parser.parse_args(argv)
+
+    runner = BatchStegoRunner(args.k_val, args.workers, args.format, args.compress_level)
+
+    results = runner.run(args.carrier_dir, args.manifest, args.output_dir)
+    for result in results:
+        detail = result['output'] if result['status'] == 'ok' else result['error']
+        print(f"{result['status']:5} {result['seconds']:8.3f}s {result['carrier']} -> {detail}")
+    failures = sum(result['status'] != 'ok' for result in results)
+    print(f"{len(results) - failures} embedded, {failures} failed, "
+          f"{sum(result['seconds'] for result in results):.3f}s total")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from PIL import Image
+from .batch_stego_runner import BatchStegoRunner
+from .least_significant_bit import LeastSignificantBit
+
+
+class TestBatchStegoRunner(unittest.TestCase):
+    def setUp(self):
+        """Create a carrier directory, a payload file and a manifest."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.carrier_dir = os.path.join(self.temp_dir.name, 'carriers')
+        self.output_dir = os.path.join(self.temp_dir.name, 'output')
+        os.makedirs(self.carrier_dir)
+
+        rng = np.random.default_rng(0)
+        for name in ('a.png', 'b.png'):
+            Image.fromarray(rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)).save(
+                os.path.join(self.carrier_dir, name))
+        with open(os.path.join(self.temp_dir.name, 'payload.bin'), 'wb') as payload:
+            payload.write(b'\x00binary\x00payload')
+
+        self.manifest_path = os.path.join(self.temp_dir.name, 'manifest.jsonl')
+        entries = [
+            {'carrier': 'a.png', 'payload': 'text payload'},
+            {'carrier': 'b.png', 'payload_file': 'payload.bin', 'output': 'b_stego.png'},
+            {'carrier': 'missing.png', 'payload': 'lost'},
+        ]
+        with open(self.manifest_path, 'w', encoding='utf-8') as manifest:
+            manifest.write('\n'.join(json.dumps(entry) for entry in entries))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_run_reports_outputs_and_failures(self):
+        """Test that every item is embedded or reported as a failure, in order."""
+        runner = BatchStegoRunner(k_val=2, workers=2, compress_level=1)
+        results = runner.run(self.carrier_dir, self.manifest_path, self.output_dir)
+
+        self.assertEqual([result['status'] for result in results], ['ok', 'ok', 'error'])
+        self.assertIn('missing.png', results[2]['error'])
+        self.assertTrue(all(result['seconds'] >= 0 for result in results))
+
+        lsb = LeastSignificantBit(k_val=2)
+        self.assertEqual(lsb.extract_payload(results[0]['output']), b'text payload')
+        self.assertEqual(os.path.basename(results[1]['output']), 'b_stego.png')
+        self.assertEqual(lsb.extract_payload(results[1]['output']), b'\x00binary\x00payload')
+
+    def test_npy_output(self):
+        """Test that the raw .npy encoder writes arrays readable by the banded extractor."""
+        runner = BatchStegoRunner(k_val=1, workers=1, output_format='npy')
+        results = runner.run(self.carrier_dir, self.manifest_path, self.output_dir)
+
+        self.assertTrue(results[0]['output'].endswith('a.npy'))
+        lsb = LeastSignificantBit(k_val=1)
+        self.assertEqual(lsb.extract_file_banded(results[0]['output']), b'text payload')
+
+        # No format means PNG rather than a failure on every item
+        results = BatchStegoRunner(k_val=1, workers=1, output_format=None).run(
+            self.carrier_dir, self.manifest_path, self.output_dir)
+        self.assertEqual([result['status'] for result in results], ['ok', 'ok', 'error'])
+        self.assertTrue(results[0]['output'].endswith('a.png'))
+
+    def test_output_names_never_collide(self):
+        """Test that repeated carriers get distinct names and explicit clashes are rejected."""
+        runner = BatchStegoRunner(k_val=1)
+        items = [{'carrier': 'a.png'}, {'carrier': 'a.png'}, {'carrier': 'a.jpg'},
+                 {'carrier': 'b.png'}, {'carrier': 'c.png', 'output': 'x.png'}]
+        self.assertEqual(runner.output_names(items),
+                         ['a_1.png', 'a_2.png', 'a_3.png', 'b.png', 'x.png'])
+        with self.assertRaises(ValueError):
+            runner.output_names(items + [{'carrier': 'd.png', 'output': 'b.png'}])
+
+        with open(self.manifest_path, 'w', encoding='utf-8') as manifest:
+            manifest.write('\n'.join(json.dumps({'carrier': 'a.png', 'payload': payload})
+                                     for payload in ('first', 'second')))
+        results = runner.run(self.carrier_dir, self.manifest_path, self.output_dir)
+        lsb = LeastSignificantBit(k_val=1)
+        self.assertEqual([lsb.extract_payload(result['output']) for result in results],
+                         [b'first', b'second'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import numpy as np
+
+
+class ImageQualityMetrics:
+    # Default number of rows processed at a time, which bounds the temporary arrays.
+    BAND_ROWS = 64
+
+    @staticmethod
+    def _as_channels(img_data):
+        """
+        View an image array as (height, width, channels).
+        """
+        img_data = np.asarray(img_data)
+        return img_data[:, :, None] if img_data.ndim == 2 else img_data
+
+    @staticmethod
+    def _check_shapes(cover, stego):
+        cover = ImageQualityMetrics._as_channels(cover)
+        stego = ImageQualityMetrics._as_channels(stego)
+        if cover.shape != stego.shape:
+            raise ValueError(
+                f"Cover and stego shapes differ: {cover.shape} vs {stego.shape}.")
+        return cover, stego
+
+    @staticmethod
+    def _row_bands(height, band_rows):
+        band_rows = band_rows or height
+        return [(start, min(start + band_rows, height)) for start in range(0, height, band_rows)]
+
+    @staticmethod
+    def mse(cover, stego, band_rows=BAND_ROWS):
+        """
+        Mean squared error between cover and stego pixels.
+
+        Args:
+            band_rows (int, optional): Process this many rows at a time to bound
+                the temporary arrays on large images; None processes the whole image.
+        """
+        cover, stego = ImageQualityMetrics._check_shapes(cover, stego)
+        total = 0
+        for start, end in ImageQualityMetrics._row_bands(cover.shape[0], band_rows):
+            diff = cover[start:end].astype(np.int64) - stego[start:end]
+            total += int(np.einsum('ijk,ijk->', diff, diff))
+        return total / cover.size
+
+    @staticmethod
+    def psnr(cover, stego, max_value=255, band_rows=BAND_ROWS):
+        """
+        Peak signal-to-noise ratio in dB; infinite for identical images.
+        """
+        return ImageQualityMetrics._psnr_from_mse(
+            ImageQualityMetrics.mse(cover, stego, band_rows), max_value)
+
+    @staticmethod
+    def _psnr_from_mse(mse, max_value=255):
+        if mse == 0:
+            return float('inf')
+        return 10 * np.log10(max_value ** 2 / mse)
+
+    @staticmethod
+    def _window_sums(data, window):
+        """
+        Sums over every window x window block (valid positions) via an integral image.
+
+        The integral image is kept in data's integer dtype and may wrap around; the
+        block sums are still exact as long as they fit in that dtype.
+        """
+        integral = np.zeros((data.shape[0] + 1, data.shape[1] + 1) + data.shape[2:],
+                            dtype=data.dtype)
+        np.cumsum(data, axis=0, dtype=data.dtype, out=integral[1:, 1:])
+        np.cumsum(integral[1:, 1:], axis=1, dtype=data.dtype, out=integral[1:, 1:])
+        return (integral[window:, window:] - integral[:-window, window:]
+                - integral[window:, :-window] + integral[:-window, :-window])
+
+    @staticmethod
+    def ssim(cover, stego, window=7, max_value=255, band_rows=BAND_ROWS):
+        """
+        Mean structural similarity over all window x window blocks and channels.
+
+        Local statistics use a uniform window computed with integer integral images,
+        which are exact, smaller and faster than floating-point ones. A window with
+        no changed pixel has an SSIM of exactly 1, so bands without changes are
+        counted without computing them; LSB payloads usually touch only the first rows.
+
+        Args:
+            band_rows (int, optional): Number of window rows per band; bands overlap
+                by window - 1 rows so the result equals the whole-image value. None
+                processes the whole image at once.
+
+        Returns:
+            float: The mean SSIM, or None if the image is smaller than the window.
+        """
+        cover, stego = ImageQualityMetrics._check_shapes(cover, stego)
+        height, width = cover.shape[:2]
+        if height < window or width < window:
+            return None
+        area = window * window
+        # Statistics are scaled by area^2: area^2 * var_x = area * sum(x^2) - sum(x)^2
+        c1 = (0.01 * max_value * area) ** 2
+        c2 = (0.03 * max_value * area) ** 2
+        # Sums of two scaled statistics (square_x + square_y, var_x + var_y) must fit
+        dtype = np.int32 if 2 * (area * max_value) ** 2 < 2 ** 31 else np.int64
+
+        changed_rows = np.concatenate([
+            (cover[start:end] != stego[start:end]).any(axis=(1, 2))
+            for start, end in ImageQualityMetrics._row_bands(height, band_rows)])
+
+        total = 0.0
+        for start, end in ImageQualityMetrics._row_bands(height - window + 1, band_rows):
+            if not changed_rows[start:end + window - 1].any():
+                total += (end - start) * (width - window + 1) * cover.shape[2]
+                continue
+            x = cover[start:end + window - 1].astype(dtype)
+            y = stego[start:end + window - 1].astype(dtype)
+            sum_x = ImageQualityMetrics._window_sums(x, window)
+            sum_y = ImageQualityMetrics._window_sums(y, window)
+            sum_xy = sum_x * sum_y
+            square_x = sum_x * sum_x
+            square_y = sum_y * sum_y
+            var_x = area * ImageQualityMetrics._window_sums(x * x, window) - square_x
+            var_y = area * ImageQualityMetrics._window_sums(y * y, window) - square_y
+            cov = area * ImageQualityMetrics._window_sums(x * y, window) - sum_xy
+
+            ssim_map = ((2.0 * sum_xy + c1) * (2.0 * cov + c2)) / \
+                ((square_x + square_y + c1) * (var_x + var_y + c2))
+            total += ssim_map.sum()
+
+        return total / ((height - window + 1) * (width - window + 1) * cover.shape[2])
+
+    @staticmethod
+    def histogram_delta(cover, stego, band_rows=BAND_ROWS):
+        """
+        Per-channel L1 distance between the 256-bin histograms of cover and stego.
+
+        Returns:
+            np.ndarray: One count per channel: the number of pixel values that would
+                have to move to turn one histogram into the other, times two.
+        """
+        cover, stego = ImageQualityMetrics._check_shapes(cover, stego)
+        channels = cover.shape[2]
+        # Offset every channel into its own block of 256 bins
+        offsets = np.arange(channels) * 256
+        delta = np.zeros(channels * 256, dtype=np.int64)
+        for start, end in ImageQualityMetrics._row_bands(cover.shape[0], band_rows):
+            # Unchanged values add to both histograms, so only changed ones are counted
+            changed = cover[start:end] != stego[start:end]
+            bins = np.broadcast_to(offsets, changed.shape)[changed]
+            delta += np.bincount(cover[start:end][changed] + bins, minlength=channels * 256)
+            delta -= np.bincount(stego[start:end][changed] + bins, minlength=channels * 256)
+        return np.abs(delta.reshape(channels, 256)).sum(axis=1)
+
+    @staticmethod
+    def compare(cover, stego, band_rows=BAND_ROWS):
+        """
+        Compute all metrics at once.
+
+        Returns:
+            dict: mse, psnr, ssim and histogram_delta (per-channel list).
+        """
+        mse = ImageQualityMetrics.mse(cover, stego, band_rows)
+        return {
+            'mse': mse,
+            'psnr': ImageQualityMetrics._psnr_from_mse(mse),
+            'ssim': ImageQualityMetrics.ssim(cover, stego, band_rows=band_rows),
+            'histogram_delta': ImageQualityMetrics.histogram_delta(
+                cover, stego, band_rows).tolist(),
+        }
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+from .image_quality_metrics import ImageQualityMetrics
+from .least_significant_bit import LeastSignificantBit
+
+
+class TestImageQualityMetrics(unittest.TestCase):
+    def setUp(self):
+        """Create a random cover and a k_val=2 stego image of it."""
+        rng = np.random.default_rng(0)
+        self.cover = rng.integers(0, 256, size=(40, 30, 3), dtype=np.uint8)
+        self.stego = LeastSignificantBit(k_val=2).embed(self.cover, rng.bytes(500))
+
+    def test_identical_images(self):
+        """Test the metrics of an image against itself."""
+        metrics = ImageQualityMetrics.compare(self.cover, self.cover)
+        self.assertEqual(metrics['mse'], 0)
+        self.assertEqual(metrics['psnr'], float('inf'))
+        self.assertAlmostEqual(metrics['ssim'], 1.0)
+        self.assertEqual(metrics['histogram_delta'], [0, 0, 0])
+
+    def test_against_direct_computation(self):
+        """Test the vectorized metrics against straightforward per-window formulas."""
+        diff = self.cover.astype(float) - self.stego
+        mse = (diff ** 2).mean()
+        self.assertAlmostEqual(ImageQualityMetrics.mse(self.cover, self.stego), mse)
+        self.assertAlmostEqual(ImageQualityMetrics.psnr(self.cover, self.stego),
+                               10 * np.log10(255 ** 2 / mse))
+
+        c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+        values = []
+        for c in range(3):
+            for i in range(40 - 7 + 1):
+                for j in range(30 - 7 + 1):
+                    x = self.cover[i:i + 7, j:j + 7, c].astype(float)
+                    y = self.stego[i:i + 7, j:j + 7, c].astype(float)
+                    cov = ((x - x.mean()) * (y - y.mean())).mean()
+                    values.append((2 * x.mean() * y.mean() + c1) * (2 * cov + c2) /
+                                  ((x.mean() ** 2 + y.mean() ** 2 + c1) * (x.var() + y.var() + c2)))
+        self.assertAlmostEqual(ImageQualityMetrics.ssim(self.cover, self.stego), np.mean(values))
+
+        expected = [np.abs(np.bincount(self.cover[:, :, c].ravel(), minlength=256) -
+                           np.bincount(self.stego[:, :, c].ravel(), minlength=256)).sum()
+                    for c in range(3)]
+        self.assertEqual(ImageQualityMetrics.histogram_delta(self.cover, self.stego).tolist(),
+                         expected)
+
+    def test_band_wise_matches_whole_image(self):
+        """Test that band-wise processing gives the whole-image results."""
+        whole = ImageQualityMetrics.compare(self.cover, self.stego)
+        banded = ImageQualityMetrics.compare(self.cover, self.stego, band_rows=6)
+        self.assertAlmostEqual(banded['mse'], whole['mse'])
+        self.assertAlmostEqual(banded['ssim'], whole['ssim'])
+        self.assertEqual(banded['histogram_delta'], whole['histogram_delta'])
+
+        gray = self.cover[:, :, 0]
+        self.assertAlmostEqual(ImageQualityMetrics.ssim(gray, gray, band_rows=5), 1.0)
+
+        # Windows large enough to need 64-bit statistics
+        white = np.full((40, 40), 255, dtype=np.uint8)
+        changed = white.copy()
+        changed[20, 20] = 254
+        for window in (11, 12, 13, 20):
+            value = ImageQualityMetrics.ssim(white, changed, window=window)
+            self.assertTrue(0.99 < value < 1.0, (window, value))
+
+                # SSIM is undefined below the window size; the other metrics still work
+        tiny = ImageQualityMetrics.compare(self.cover[:5, :5], self.stego[:5, :5])
+        self.assertIsNone(tiny['ssim'])
+        self.assertGreaterEqual(tiny['mse'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,90 @@
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageMode
+import io
 import numpy as np
+import os
+import shutil
+import struct
+import zlib
 
 
 class LeastSignificantBit:
-    def __init__(self, k_val=1):
+    # Payload header: magic, k_val (low nibble) and channel mask (high nibble, 0 for
+    # all channels), payload length in bytes, CRC32 of the payload.
+    HEADER_MAGIC = b'LSBH'
+    HEADER_FORMAT = '>4sBII'
+    HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+    # The header is always stored with 1 bit per channel value, so it can be read
+    # before k_val is known.
+    HEADER_K_VAL = 1
+    HEADER_VALUES = HEADER_SIZE * 8 // HEADER_K_VAL
+    # Shard header in front of each shard's payload: magic, shard index, shard count,
+    # total payload length, CRC32 of the total payload.
+    SHARD_MAGIC = b'LSBS'
+    SHARD_FORMAT = '>4sHHII'
+    SHARD_HEADER_SIZE = struct.calcsize(SHARD_FORMAT)
+    # Lossless output formats of encode_image and their MIME types.
+    OUTPUT_FORMATS = {
+        'PNG': 'image/png',
+        'BMP': 'image/bmp',
+        'TIFF': 'image/tiff',
+        'NPY': 'application/octet-stream',
+    }
+    FORMAT_EXTENSIONS = {
+        '.png': 'PNG', '.bmp': 'BMP', '.tif': 'TIFF', '.tiff': 'TIFF', '.npy': 'NPY'}
+    # Default number of channel values processed per band of a framed payload.
+    BAND_VALUES = 1 << 22
+    # Channels the planner fills first: the eye is least sensitive to blue, and
+    # alpha changes are the most visible, so it comes last.
+    CHANNEL_PREFERENCE = {'B': 0, 'R': 1, 'G': 2, 'A': 4}
+
+    def __init__(self, k_val=1, band_values=None, workers=1, output_format=None,
+                 compress_level=None, channels=None):
         """
         Initialize the LeastSignificantBit class.
 
         Args:
             k_val (int): The number of least significant bits to use for embedding.
+            band_values (int, optional): Number of channel values processed per band,
+                which bounds the temporary arrays.
+            workers (int): Number of threads bands are processed on. NumPy releases
+                the GIL, so large carriers scale with the number of cores.
+            output_format (str, optional): Format stego images are encoded in: PNG,
+                BMP, TIFF or NPY. If None, it follows the output file extension.
+            compress_level (int, optional): PNG zlib level from 0 (no compression,
+                fastest) to 9. If None, PIL's default of 6 is used.
+            channels (iterable, optional): Indices (0-3) of the channels framed
+                payloads are embedded in. If None, all channels are used.
         """
         if not (1 <= k_val <= 8):
             raise ValueError("k_val must be between 1 and 8.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
         self.k_val = k_val
+        # A multiple of 8 values always holds whole bytes
+        self.band_values = max(8, (band_values or self.BAND_VALUES) // 8 * 8)
+        self.workers = workers
+        if output_format is not None and output_format.upper() not in self.OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {', '.join(self.OUTPUT_FORMATS)}.")
+        if compress_level is not None and not (0 <= compress_level <= 9):
+            raise ValueError("compress_level must be between 0 and 9.")
+        self.output_format = output_format.upper() if output_format else None
+        self.compress_level = compress_level
+        if channels is not None:
+            channels = tuple(sorted(set(channels)))
+            if not channels or not all(0 <= channel < 4 for channel in channels):
+                raise ValueError("channels must be a non-empty subset of 0, 1, 2 and 3.")
+        self.channels = channels
+
+    def _run_bands(self, function, bands):
+        """
+        Call function(*band) for every band, on a thread pool when workers > 1.
+        """
+        if self.workers > 1 and len(bands) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(lambda band: function(*band), bands))
+        return [function(*band) for band in bands]
 
     @staticmethod
     def message_to_bits(message):
@@ -53,55 +125,629 @@ class LeastSignificantBit:
         mask = ~((1 << k_val) - 1) & 0xFF
         return (binary_number & mask) | binary_literal
 
-    def embed_message(self, input_image_path, output_image_path, message):
+    @staticmethod
+    def message_to_bit_array(message):
+        """
+        Convert a string message to an array of bits, equal to message_to_bits.
+        """
+        try:
+            return np.unpackbits(np.frombuffer(message.encode('latin-1'), dtype=np.uint8))
+        except UnicodeEncodeError:
+            # Code points above 255 take more than 8 bits in message_to_bits
+            bits = LeastSignificantBit.message_to_bits(message)
+            return np.frombuffer(bits.encode('ascii'), dtype=np.uint8) - ord('0')
+
+    @staticmethod
+    def bits_to_values(bits, k_val):
+        """
+        Group a bit array into k_val-bit values.
+
+        A shorter last group is right-aligned, as change_n_lsb does with it.
+        """
+        full = len(bits) // k_val * k_val
+        weights = 1 << np.arange(k_val - 1, -1, -1)
+        values = bits[:full].reshape(-1, k_val) @ weights
+        if full < len(bits):
+            tail = bits[full:]
+            values = np.append(values, tail @ weights[k_val - len(tail):])
+        return values.astype(np.uint8)
+
+    @staticmethod
+    def embed_values(flat_data, start, values, k_val):
+        """
+        Write k_val-bit values into the LSBs of flat_data[start:start + len(values)].
+        """
+        mask = np.uint8(~((1 << k_val) - 1) & 0xFF)
+        target = flat_data[start:start + len(values)]
+        np.bitwise_and(target, mask, out=target)
+        np.bitwise_or(target, values, out=target)
+
+    def embed_message(self, input_image_path, output_image_path, message,
+                      return_encoded=False):
         """
         Modify pixel values of an image to embed a message.
+
+        With return_encoded, also return the bytes written to output_image_path
+        (see save_image), so callers can serve them without encoding again.
         """
         message += '\0'
-        message_bits = self.message_to_bits(message)
+        message_bits = self.message_to_bit_array(message)
 
         image = Image.open(input_image_path)
         img_data = np.array(image)
 
-        height, width, channels = img_data.shape
-        capacity = height * width * channels * self.k_val
+        capacity = img_data.size * self.k_val
         if len(message_bits) > capacity:
             raise ValueError(
                 f"Message too long! Capacity: {capacity} bits, Message: {len(message_bits)} bits.")
 
-        bit_idx = 0
-        for h in range(height):
-            for w in range(width):
-                for c in range(channels):
-                    if bit_idx < len(message_bits):
-                        original_value = img_data[h, w, c]
-                        bits_to_embed = message_bits[bit_idx:bit_idx + self.k_val]
-                        img_data[h, w, c] = self.change_n_lsb(
-                            original_value, bits_to_embed, self.k_val)
-                        bit_idx += self.k_val
-                if bit_idx >= len(message_bits):
-                    break
-            if bit_idx >= len(message_bits):
-                break
+        # Pixels are filled row by row, channel by channel: the flattened order
+        flat_data = img_data.reshape(-1)
+        values = self.bits_to_values(message_bits, self.k_val)
+        self._run_bands(
+            lambda start, end: self.embed_values(
+                flat_data, start, values[start:end], self.k_val),
+            [(start, min(start + self.band_values, len(values)))
+             for start in range(0, len(values), self.band_values)])
 
         stego_image = Image.fromarray(img_data)
-        stego_image.save(output_image_path)
-        return stego_image
+        encoded = self.save_image(img_data, output_image_path)
+        return (stego_image, encoded) if return_encoded else stego_image
+
+    @staticmethod
+    def extract_bits(flat_data, start, count, k_val):
+        """
+        Read the k_val LSBs of flat_data[start:start + count] as a bit array.
+        """
+        values = flat_data[start:start + count] & ((1 << k_val) - 1)
+        bits = np.unpackbits(values.astype(np.uint8)[:, None], axis=1)
+        return bits[:, 8 - k_val:].reshape(-1)
+
+    def extract_bytes(self, flat_data, count):
+        """
+        Read the LSBs of the first count channel values as whole bytes.
+
+        The values are split into bands that are decoded in parallel; a trailing
+        partial byte is dropped.
+        """
+        def extract_band(start, end):
+            bits = self.extract_bits(flat_data, start, end - start, self.k_val)
+            return np.packbits(bits[:len(bits) // 8 * 8]).tobytes()
+
+        return b''.join(self._run_bands(
+            extract_band,
+            [(start, min(start + self.band_values, count))
+             for start in range(0, count, self.band_values)]))
 
     def extract_message(self, stego_image_path):
         """
         Extract a hidden message from an image that uses LSB encoding.
+
+        Pixels are read in growing blocks until the '\0' terminator shows up, so
+        the work scales with the message length rather than the image size.
         """
         image = Image.open(stego_image_path)
-        img_data = np.array(image)
+        flat_data = np.asarray(image).reshape(-1)
+
+        block = 1024
+        scanned = 0
+        while True:
+            end = min(block, flat_data.size)
+            data = np.frombuffer(self.extract_bytes(flat_data, end), dtype=np.uint8)
+
+            terminator = np.flatnonzero(data[scanned:] == 0)
+            if terminator.size:
+                data = data[:scanned + terminator[0]]
+                break
+            if end == flat_data.size:
+                break
+            scanned = len(data)
+            block *= 4
+
+        return data.tobytes().decode('latin-1')
+
+    def payload_capacity(self, value_count, channel_count=1):
+        """
+        Return how many payload bytes fit behind the header in value_count channel values.
+
+        channel_count is the number of channels per pixel; it only matters when a
+        channel subset is used.
+        """
+        if self.channels is None:
+            return max(0, (value_count - self.HEADER_VALUES) * self.k_val // 8)
+        self._check_channels(self.channels, channel_count)
+        header_pixels = -(-self.HEADER_VALUES // channel_count)
+        usable = (value_count // channel_count - header_pixels) * len(self.channels)
+        return max(0, usable * self.k_val // 8)
+
+    @staticmethod
+    def _channel_count(img_data):
+        return img_data.shape[2] if img_data.ndim == 3 else 1
+
+    @staticmethod
+    def _check_channels(channels, channel_count):
+        if channels is not None and channels[-1] >= channel_count:
+            raise ValueError(
+                f"Channel {channels[-1]} does not exist in a {channel_count}-channel image.")
+
+    def _region_band(self, flat_data, channel_count, channels, start, count):
+        """
+        Values [start, start + count) of the payload region, the channel values behind
+        the header, touching only the pixels of that band.
+
+        Returns:
+            tuple: (1-D array, store). store is None when the array is a view of
+                flat_data; otherwise store() writes the array back into flat_data.
+        """
+        if channels is None:
+            offset = self.HEADER_VALUES + start
+            return flat_data[offset:offset + count], None
+        header_pixels = -(-self.HEADER_VALUES // channel_count)
+        pixels = flat_data[:flat_data.size // channel_count * channel_count] \
+            .reshape(-1, channel_count)
+        if len(channels) == 1:
+            first = header_pixels + start
+            return pixels[first:first + count, channels[0]], None
+        # Gather exactly the band's values, so concurrent bands that share a pixel
+        # never write each other's channels
+        positions = np.arange(start, start + count)
+        rows = header_pixels + positions // len(channels)
+        columns = np.asarray(channels)[positions % len(channels)]
+        values = pixels[rows, columns]
+
+        def store():
+            pixels[rows, columns] = values
+
+        return values, store
+
+    def _embed_payload_values(self, flat_data, payload, channel_count=1):
+        """
+        Write the header and the payload into a flattened pixel buffer.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        capacity = self.payload_capacity(flat_data.size, channel_count)
+        if len(payload) > capacity:
+            raise ValueError(
+                f"Message too long! Capacity: {capacity} bytes, Message: {len(payload)} bytes.")
+
+        channel_mask = sum(1 << channel for channel in self.channels or ())
+        header = struct.pack(self.HEADER_FORMAT, self.HEADER_MAGIC,
+                             self.k_val | channel_mask << 4, len(payload), zlib.crc32(payload))
+        header_bits = np.unpackbits(np.frombuffer(header, dtype=np.uint8))
+        self.embed_values(flat_data, 0, self.bits_to_values(header_bits, self.HEADER_K_VAL),
+                          self.HEADER_K_VAL)
+
+        def embed_band(start, end, offset):
+            bits = np.unpackbits(np.frombuffer(payload[start:end], dtype=np.uint8))
+            values = self.bits_to_values(bits, self.k_val)
+            band, store = self._region_band(
+                flat_data, channel_count, self.channels, offset, len(values))
+            self.embed_values(band, 0, values, self.k_val)
+            if store is not None:
+                store()
+
+        self._run_bands(embed_band, list(self._payload_bands(len(payload))))
+
+    def _payload_bands(self, length):
+        """
+        Split a payload into bands of whole k_val-bit groups.
+
+        Yields:
+            tuple: (first byte, end byte, offset of the band's first channel value
+                in the payload region).
+        """
+        # k_val bytes are exactly 8 values, so only the last band has a short group
+        band_bytes = self.k_val * max(1, self.band_values // 8)
+        for start in range(0, length, band_bytes):
+            yield start, min(start + band_bytes, length), start * 8 // self.k_val
+
+    def _extract_band(self, flat_data, start, end, offset, channel_count=1, channels=None):
+        """
+        Read payload bytes [start, end) from the payload region values starting at offset.
+        """
+        count = -(-(end - start) * 8 // self.k_val)
+        band, _ = self._region_band(flat_data, channel_count, channels, offset, count)
+        bits = self.extract_bits(band, 0, count, self.k_val)
+        if len(bits) % 8:
+            # The last group was right-aligned when embedded
+            last = len(bits) - self.k_val
+            bits = np.concatenate((bits[:last], bits[last + len(bits) % 8:]))
+        return np.packbits(bits).tobytes()
+
+    def _read_header(self, flat_data):
+        """
+        Read and validate the payload header of a flattened pixel buffer.
+
+        Returns:
+            tuple: (k_val, channels, payload length, CRC32) stored in the header;
+                channels is None when all channels are used.
+        """
+        if flat_data.size < self.HEADER_VALUES:
+            raise ValueError("Image is too small to hold a payload header.")
+        bits = self.extract_bits(flat_data, 0, self.HEADER_VALUES, self.HEADER_K_VAL)
+        magic, k_byte, length, crc = struct.unpack(self.HEADER_FORMAT, np.packbits(bits).tobytes())
+        if magic != self.HEADER_MAGIC:
+            raise ValueError("No LSB payload header found in the image.")
+        k_val = k_byte & 0x0F
+        if not (1 <= k_val <= 8):
+            raise ValueError(f"Corrupt payload header: k_val {k_val}.")
+        channels = tuple(channel for channel in range(4) if k_byte >> 4 & 1 << channel)
+        return k_val, channels or None, length, crc
+
+    def _extract_payload_values(self, flat_data, channel_count=1):
+        """
+        Read exactly the framed payload from a flattened pixel buffer.
+        """
+        k_val, channels, length, crc = self._read_header(flat_data)
+        if k_val != self.k_val:
+            raise ValueError(
+                f"Payload was embedded with k_val={k_val}, not k_val={self.k_val}.")
+        if channels != self.channels:
+            raise ValueError(
+                f"Payload was embedded in channels {channels}, not {self.channels}.")
+        if length > self.payload_capacity(flat_data.size, channel_count):
+            raise ValueError("Corrupt payload header: length exceeds the image capacity.")
+
+        payload = b''.join(self._run_bands(
+            lambda start, end, offset: self._extract_band(
+                flat_data, start, end, offset, channel_count, channels),
+            list(self._payload_bands(length))))
+        if zlib.crc32(payload) != crc:
+            raise ValueError("Payload CRC32 mismatch: the image is damaged or not a stego image.")
+        return payload
+
+    def embed(self, carrier, payload, in_place=False):
+        """
+        Embed a framed payload into an in-memory carrier without touching disk.
+
+        Args:
+            carrier (np.ndarray or PIL.Image.Image): The cover pixels.
+            payload (bytes or str): The payload; str is encoded as UTF-8.
+            in_place (bool): Modify the caller's uint8 array instead of a copy. The
+                array must be C-contiguous and writable.
+
+        Returns:
+            np.ndarray: The stego pixels.
+        """
+        if in_place:
+            if not (isinstance(carrier, np.ndarray) and carrier.dtype == np.uint8
+                    and carrier.flags.c_contiguous and carrier.flags.writeable):
+                raise ValueError(
+                    "in_place needs a writable, C-contiguous uint8 NumPy array.")
+            img_data = carrier
+        else:
+            img_data = np.array(carrier, dtype=np.uint8)
+
+        self._embed_payload_values(img_data.reshape(-1), payload, self._channel_count(img_data))
+        return img_data
 
-        height, width, channels = img_data.shape
-        extracted_bits = ""
-        for h in range(height):
-            for w in range(width):
-                for c in range(channels):
-                    pixel_value = img_data[h, w, c]
-                    lsb_bits = format(pixel_value, '08b')[-self.k_val:]
-                    extracted_bits += lsb_bits
+    def extract(self, carrier):
+        """
+        Extract a framed payload from an in-memory carrier.
+
+        Args:
+            carrier (np.ndarray or PIL.Image.Image): The stego pixels.
+
+        Returns:
+            bytes: The payload.
+        """
+        img_data = np.asarray(carrier)
+        return self._extract_payload_values(img_data.reshape(-1), self._channel_count(img_data))
 
-        return self.bits_to_message(extracted_bits)
+    @classmethod
+    def read_header(cls, carrier):
+        """
+        Read the payload header of a stego carrier.
+
+        Args:
+            carrier (np.ndarray or PIL.Image.Image): The stego pixels.
+
+        Returns:
+            tuple: (k_val, channels, payload length); channels is None when the
+                payload uses all channels.
+        """
+        k_val, channels, length, _ = cls()._read_header(np.asarray(carrier).reshape(-1))
+        return k_val, channels, length
+
+    @classmethod
+    def from_header(cls, carrier, **kwargs):
+        """
+        Create an extractor with the k_val and channels stored in a carrier's header.
+
+        Other keyword arguments are passed to the constructor.
+        """
+        k_val, channels, _ = cls.read_header(carrier)
+        return cls(k_val=k_val, channels=channels, **kwargs)
+
+    @staticmethod
+    def carrier_geometry(image):
+        """
+        Return (shape, mode) of an image file or PIL image without decoding its pixels.
+
+        The shape is (height, width), or (height, width, channels) for multi-band
+        modes, as np.array would give it.
+        """
+        if isinstance(image, Image.Image):
+            width, height = image.size
+            bands, mode = len(image.getbands()), image.mode
+        else:
+            with Image.open(image) as opened:
+                width, height = opened.size
+                bands, mode = len(opened.getbands()), opened.mode
+        return ((height, width, bands) if bands > 1 else (height, width)), mode
+
+    @classmethod
+    def plan(cls, payload_size, shape, mode=None, channel_subset=False):
+        """
+        Pick the smallest k_val whose framed payload fits in a carrier.
+
+        Args:
+            payload_size (int): Payload length in bytes.
+            shape (tuple): Carrier shape, as returned by carrier_geometry.
+            mode (str, optional): PIL mode of the carrier, used to order the channels
+                of a subset (blue first, alpha last).
+            channel_subset (bool): At the chosen k_val, also pick the fewest channels
+                that still fit the payload.
+
+        Returns:
+            tuple: (k_val, channels); channels is None for all channels.
+        """
+        value_count = int(np.prod(shape))
+        channel_count = shape[2] if len(shape) == 3 else 1
+        order = list(range(channel_count))
+        if mode is not None and len(ImageMode.getmode(mode).bands) == channel_count:
+            bands = ImageMode.getmode(mode).bands
+            order.sort(key=lambda channel: cls.CHANNEL_PREFERENCE.get(bands[channel], 3))
+
+        for k_val in range(1, 9):
+            if channel_subset and 1 < channel_count <= 4:
+                for count in range(1, channel_count):
+                    lsb = cls(k_val, channels=order[:count])
+                    if lsb.payload_capacity(value_count, channel_count) >= payload_size:
+                        return k_val, lsb.channels
+            if cls(k_val).payload_capacity(value_count) >= payload_size:
+                return k_val, None
+        raise ValueError(
+            f"Message too long! Capacity: {cls(8).payload_capacity(value_count)} bytes, "
+            f"Message: {payload_size} bytes.")
+
+    @classmethod
+    def plan_shards(cls, payload_size, shapes):
+        """
+        Pick the smallest k_val at which embed_shards fits a payload over several carriers.
+
+        Args:
+            payload_size (int): Payload length in bytes.
+            shapes (list): Carrier shapes, as returned by carrier_geometry.
+
+        Returns:
+            int: The k_val; every carrier uses all of its channels.
+        """
+        value_counts = [int(np.prod(shape)) for shape in shapes]
+        for k_val in range(1, 9):
+            capacities = [cls(k_val).payload_capacity(value_count) - cls.SHARD_HEADER_SIZE
+                          for value_count in value_counts]
+            if min(capacities) >= 0 and sum(capacities) >= payload_size:
+                return k_val
+        capacities = [cls(8).payload_capacity(value_count) - cls.SHARD_HEADER_SIZE
+                      for value_count in value_counts]
+        for index, capacity in enumerate(capacities):
+            if capacity < 0:
+                raise ValueError(f"Carrier {index} is too small to hold a shard header.")
+        capacity = sum(capacities)
+        raise ValueError(
+            f"Message too long! Capacity: {capacity} bytes, Message: {payload_size} bytes.")
+
+    def embed_payload(self, input_image_path, output_image_path, payload,
+                      return_encoded=False):
+        """
+        Embed a payload behind a header instead of a '\0' terminator.
+
+        The header (magic, k_val, length, CRC32) lets arbitrary bytes, including NUL,
+        be embedded and read back exactly. A str payload is encoded as UTF-8.
+        return_encoded works as in embed_message.
+        """
+        image = Image.open(input_image_path)
+        img_data = self.embed(image, payload)
+
+        stego_image = Image.fromarray(img_data)
+        encoded = self.save_image(img_data, output_image_path)
+        return (stego_image, encoded) if return_encoded else stego_image
+
+    def extract_payload(self, stego_image_path):
+        """
+        Extract a payload embedded with embed_payload as bytes.
+
+        Only the header and the payload pixels are decoded. Raises ValueError when
+        the image has no header, uses a different k_val or fails the CRC32 check.
+        """
+        return self.extract(Image.open(stego_image_path))
+
+    @staticmethod
+    def open_raw_carrier(path, mode='r', shape=None):
+        """
+        Memory-map a .npy carrier, or a raw uint8 pixel file of the given shape.
+        """
+        if shape is None:
+            img_data = np.load(path, mmap_mode=mode)
+        else:
+            img_data = np.memmap(path, dtype=np.uint8, mode=mode, shape=shape)
+        if img_data.dtype != np.uint8 or not img_data.flags.c_contiguous:
+            raise ValueError("Raw carriers must be C-contiguous uint8 arrays.")
+        return img_data
+
+    def embed_file_banded(self, input_path, output_path, payload, shape=None):
+        """
+        Embed a framed payload into a memory-mapped .npy or raw carrier.
+
+        The carrier is copied to output_path (or modified in place when output_path
+        is None) and only the bands holding header and payload values are paged in,
+        so peak memory follows band_values rather than the image size.
+        """
+        if output_path is None:
+            output_path = input_path
+        else:
+            shutil.copyfile(input_path, output_path)
+
+        img_data = self.open_raw_carrier(output_path, 'r+', shape)
+        self._embed_payload_values(img_data.reshape(-1), payload, self._channel_count(img_data))
+        img_data.flush()
+        return output_path
+
+    def extract_file_banded(self, stego_path, shape=None):
+        """
+        Extract a framed payload from a memory-mapped .npy or raw carrier.
+        """
+        img_data = self.open_raw_carrier(stego_path, 'r', shape)
+        return self._extract_payload_values(img_data.reshape(-1), self._channel_count(img_data))
+
+    def embed_shards(self, carriers, payload):
+        """
+        Spread one payload over several carriers, embedded concurrently.
+
+        The payload is split in proportion to each carrier's capacity and every
+        shard carries its index, the shard count, the total length and a CRC32 of
+        the whole payload, so extract_shards can reassemble it in any order.
+
+        Args:
+            carriers (list): NumPy arrays or PIL images. Each must hold at least
+                the shard header.
+            payload (bytes or str): The payload; str is encoded as UTF-8.
+
+        Returns:
+            list: The stego arrays, in the order of carriers.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        if not carriers:
+            raise ValueError("At least one carrier is required.")
+        carriers = [np.asarray(carrier) for carrier in carriers]
+
+        capacities = [self.payload_capacity(carrier.size, self._channel_count(carrier))
+                      - self.SHARD_HEADER_SIZE for carrier in carriers]
+        for index, capacity in enumerate(capacities):
+            if capacity < 0:
+                raise ValueError(f"Carrier {index} is too small to hold a shard header.")
+        total_capacity = sum(capacities)
+        if len(payload) > total_capacity:
+            raise ValueError(
+                f"Message too long! Capacity: {total_capacity} bytes, "
+                f"Message: {len(payload)} bytes.")
+
+        sizes = [len(payload) * capacity // total_capacity if total_capacity else 0
+                 for capacity in capacities]
+        leftover = len(payload) - sum(sizes)
+        for i, capacity in enumerate(capacities):
+            extra = min(leftover, capacity - sizes[i])
+            sizes[i] += extra
+            leftover -= extra
+
+        crc = zlib.crc32(payload)
+        shards = []
+        start = 0
+        for index, size in enumerate(sizes):
+            header = struct.pack(self.SHARD_FORMAT, self.SHARD_MAGIC, index, len(carriers),
+                                 len(payload), crc)
+            shards.append(header + payload[start:start + size])
+            start += size
+
+        with ThreadPoolExecutor(max_workers=self.workers * len(carriers)) as executor:
+            return list(executor.map(self.embed, carriers, shards))
+
+    def extract_shards(self, carriers):
+        """
+        Reassemble a payload from carriers written by embed_shards, in any order.
+
+        Args:
+            carriers (list): NumPy arrays or PIL images holding all the shards.
+
+        Returns:
+            bytes: The payload.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers * max(1, len(carriers))) as executor:
+            shards = list(executor.map(self.extract, carriers))
+
+        parts = {}
+        expected = None
+        for shard in shards:
+            if len(shard) < self.SHARD_HEADER_SIZE:
+                raise ValueError("Payload is not a shard.")
+            magic, index, count, length, crc = struct.unpack(
+                self.SHARD_FORMAT, shard[:self.SHARD_HEADER_SIZE])
+            if magic != self.SHARD_MAGIC:
+                raise ValueError("Payload is not a shard.")
+            if expected is None:
+                expected = (count, length, crc)
+            elif (count, length, crc) != expected:
+                raise ValueError("Shards belong to different payloads.")
+            parts[index] = shard[self.SHARD_HEADER_SIZE:]
+
+        if expected is None or sorted(parts) != list(range(expected[0])):
+            raise ValueError("Missing or duplicate shards.")
+        payload = b''.join(parts[index] for index in range(expected[0]))
+        if len(payload) != expected[1] or zlib.crc32(payload) != expected[2]:
+            raise ValueError("Reassembled payload fails the length or CRC32 check.")
+        return payload
+
+    def encode_image(self, img_data, output_format=None):
+        """
+        Encode stego pixels once, in a fast lossless format.
+
+        Args:
+            img_data (np.ndarray): The stego pixels.
+            output_format (str, optional): PNG, BMP, TIFF or NPY; defaults to the
+                instance's output_format, or PNG.
+
+        Returns:
+            bytes: The encoded image.
+        """
+        output_format = (output_format or self.output_format or 'PNG').upper()
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {', '.join(self.OUTPUT_FORMATS)}.")
+
+        buffer = io.BytesIO()
+        if output_format == 'NPY':
+            np.save(buffer, np.asarray(img_data))
+        elif output_format == 'PNG':
+            options = {} if self.compress_level is None else {
+                'compress_level': self.compress_level}
+            Image.fromarray(img_data).save(buffer, format='PNG', **options)
+        else:
+            # BMP and TIFF are written uncompressed
+            Image.fromarray(img_data).save(buffer, format=output_format)
+        return buffer.getvalue()
+
+    def save_image(self, img_data, output_image_path):
+        """
+        Encode stego pixels and write them to a path or file object.
+
+        Returns:
+            bytes: The encoded image, or None when PIL picked an unlisted format
+                (e.g. JPEG) from the file extension.
+        """
+        output_format = self.output_format
+        if output_format is None and isinstance(output_image_path, (str, os.PathLike)):
+            extension = os.path.splitext(os.fspath(output_image_path))[1].lower()
+            output_format = self.FORMAT_EXTENSIONS.get(extension)
+            if output_format is None:
+                Image.fromarray(img_data).save(output_image_path)
+                return None
+
+        encoded = self.encode_image(img_data, output_format)
+        if isinstance(output_image_path, (str, os.PathLike)):
+            with open(output_image_path, 'wb') as output_file:
+                output_file.write(encoded)
+        else:
+            output_image_path.write(encoded)
+        return encoded
+
+    def embed_to_bytes(self, carrier, payload, output_format=None):
+        """
+        Embed a framed payload and return the encoded stego image.
+
+        Callers get the bytes they serve or store directly, so the image is encoded
+        exactly once.
+        """
+        return self.encode_image(self.embed(carrier, payload), output_format)
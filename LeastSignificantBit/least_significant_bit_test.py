@@ -1,4 +1,5 @@
 
+import io
 import unittest
 import numpy as np
 from PIL import Image
@@ -74,6 +75,240 @@ class TestLeastSignificantBit(unittest.TestCase):
         print(
             f"Hiding capacity test passed. Max capacity: {max_capacity}, Hiding capacity: {hiding_capacity}")
 
+    def test_embed_matches_per_pixel_reference(self):
+        """Test that the vectorized embedding matches the original per-pixel loop."""
+        rng = np.random.default_rng(0)
+        cover = rng.integers(0, 256, size=(16, 16, 3), dtype=np.uint8)
+        Image.fromarray(cover).save(self.input_image_path)
+
+        for k_val in (1, 3, 5, 8):
+            for message in ("Hi!", "carrier \u0100\u2603 text"):
+                stego = LeastSignificantBit(k_val=k_val)
+                bits = stego.message_to_bits(message + '\0')
+                expected = cover.copy().reshape(-1)
+                for i, start in enumerate(range(0, len(bits), k_val)):
+                    expected[i] = stego.change_n_lsb(
+                        expected[i], bits[start:start + k_val], k_val)
+
+                stego_image = stego.embed_message(
+                    self.input_image_path, self.output_image_path, message)
+                np.testing.assert_array_equal(
+                    np.array(stego_image).reshape(-1), expected)
+
+    def test_extract_matches_full_scan(self):
+        """Test that early-terminating extraction matches decoding every pixel."""
+        rng = np.random.default_rng(1)
+        for k_val in (1, 3, 8):
+            stego = LeastSignificantBit(k_val=k_val)
+            noise = rng.integers(1, 256, size=(64, 64, 3), dtype=np.uint8)
+            noise |= 1 << (k_val - 1)  # No accidental terminator
+            Image.fromarray(noise).save(self.input_image_path)
+
+            full_scan = stego.bits_to_message(''.join(
+                format(value, '08b')[-k_val:] for value in noise.reshape(-1)))
+            self.assertEqual(stego.extract_message(self.input_image_path), full_scan)
+
+            stego.embed_message(self.input_image_path, self.output_image_path, "short")
+            self.assertEqual(stego.extract_message(self.output_image_path), "short")
+
+    def test_payload_header_round_trip(self):
+        """Test that framed payloads keep NUL bytes and code points above 255."""
+        for payload in (b"\x00lzw\x00output\x00", "\u0100\u0101 lzw codes", b""):
+            self.stego.embed_payload(
+                self.input_image_path, self.output_image_path, payload)
+            extracted = self.stego.extract_payload(self.output_image_path)
+            expected = payload.encode('utf-8') if isinstance(payload, str) else payload
+            self.assertEqual(extracted, expected)
+
+    def test_payload_header_detects_wrong_k_val_and_plain_images(self):
+        """Test that a wrong k_val, a plain image and a damaged payload are reported."""
+        with self.assertRaises(ValueError):
+            self.stego.extract_payload(self.input_image_path)
+
+        self.stego.embed_payload(
+            self.input_image_path, self.output_image_path, b"payload")
+        with self.assertRaises(ValueError):
+            LeastSignificantBit(k_val=3).extract_payload(self.output_image_path)
+
+        img_data = np.array(Image.open(self.output_image_path))
+        img_data.reshape(-1)[LeastSignificantBit.HEADER_VALUES] ^= 1
+        Image.fromarray(img_data).save(self.output_image_path)
+        with self.assertRaises(ValueError):
+            self.stego.extract_payload(self.output_image_path)
+
+    def test_in_memory_embed_extract(self):
+        """Test the array and PIL image API, including in-place embedding."""
+        cover = np.zeros((32, 32, 3), dtype=np.uint8)
+        stego_data = self.stego.embed(cover, b"in memory")
+        self.assertFalse(cover.any())
+        self.assertEqual(self.stego.extract(stego_data), b"in memory")
+        self.assertEqual(self.stego.extract(Image.fromarray(stego_data)), b"in memory")
+
+        image = Image.fromarray(cover)
+        self.assertEqual(self.stego.extract(self.stego.embed(image, "pil")), b"pil")
+
+        result = self.stego.embed(cover, b"\x00in place", in_place=True)
+        self.assertIs(result, cover)
+        self.assertEqual(self.stego.extract(cover), b"\x00in place")
+        with self.assertRaises(ValueError):
+            self.stego.embed(cover[:, ::2], b"strided", in_place=True)
+
+    def test_banded_memmap_embedding(self):
+        """Test banded embedding into memory-mapped .npy and raw carriers."""
+        stego = LeastSignificantBit(k_val=3, band_values=64)
+        payload = bytes(range(256)) * 8
+        np.save('carrier.npy', self.image_data)
+        self.image_data.tofile('carrier.raw')
+        try:
+            stego.embed_file_banded('carrier.npy', 'stego.npy', payload)
+            self.assertEqual(stego.extract_file_banded('stego.npy'), payload)
+            self.assertEqual(stego.extract(np.load('stego.npy')), payload)
+            np.testing.assert_array_equal(
+                np.load('stego.npy'), stego.embed(self.image_data, payload))
+
+            stego.embed_file_banded('carrier.raw', None, payload, shape=self.image_data.shape)
+            self.assertEqual(
+                stego.extract_file_banded('carrier.raw', shape=self.image_data.shape), payload)
+        finally:
+            for path in ('carrier.npy', 'stego.npy', 'carrier.raw'):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_thread_pool_bands_match_serial(self):
+        """Test that band-parallel embedding and extraction match the serial path."""
+        serial = LeastSignificantBit(k_val=3)
+        parallel = LeastSignificantBit(k_val=3, band_values=1000, workers=4)
+        payload = bytes(range(256)) * 100
+
+        stego_data = serial.embed(self.image_data, payload)
+        np.testing.assert_array_equal(parallel.embed(self.image_data, payload), stego_data)
+        self.assertEqual(parallel.extract(stego_data), payload)
+        self.assertEqual(parallel.extract_bytes(stego_data.reshape(-1), stego_data.size),
+                         serial.extract_bytes(stego_data.reshape(-1), stego_data.size))
+
+        message = self.message[:5000]
+        serial.embed_message(self.input_image_path, self.output_image_path, message)
+        expected = np.array(Image.open(self.output_image_path))
+        parallel.embed_message(self.input_image_path, self.output_image_path, message)
+        np.testing.assert_array_equal(np.array(Image.open(self.output_image_path)), expected)
+        self.assertEqual(parallel.extract_message(self.output_image_path), message)
+
+    def test_sharded_embedding(self):
+        """Test that a payload too long for one carrier is spread and reassembled."""
+        rng = np.random.default_rng(2)
+        carriers = [rng.integers(0, 256, size=shape, dtype=np.uint8)
+                    for shape in ((40, 40, 3), (64, 32, 3), (20, 50, 4))]
+        payload = rng.bytes(sum(self.stego.payload_capacity(carrier.size)
+                                for carrier in carriers) - 100)
+        with self.assertRaises(ValueError):
+            self.stego.embed(carriers[0], payload)
+
+        stego_carriers = self.stego.embed_shards(carriers, payload)
+        self.assertEqual(len(stego_carriers), 3)
+        self.assertEqual(self.stego.extract_shards(stego_carriers[::-1]), payload)
+        with self.assertRaises(ValueError):
+            self.stego.extract_shards(stego_carriers[:2])
+        with self.assertRaises(ValueError):
+            self.stego.embed_shards(carriers, payload + bytes(100))
+        # A carrier that cannot hold a shard header is rejected up front
+        with self.assertRaises(ValueError) as context:
+            self.stego.embed_shards([carriers[0], np.zeros((6, 6, 3), np.uint8)], b"x" * 100)
+        self.assertIn("Carrier 1", str(context.exception))
+
+    def test_output_formats(self):
+        """Test that every output format decodes back to the same stego pixels."""
+        stego_data = self.stego.embed(self.image_data, b"formats")
+        for output_format in ('PNG', 'BMP', 'TIFF'):
+            encoded = self.stego.encode_image(stego_data, output_format)
+            decoded = np.array(Image.open(io.BytesIO(encoded)))
+            np.testing.assert_array_equal(decoded, stego_data)
+        encoded = LeastSignificantBit(k_val=2, output_format='npy').embed_to_bytes(
+            self.image_data, b"formats")
+        np.testing.assert_array_equal(np.load(io.BytesIO(encoded)), stego_data)
+
+        fast = LeastSignificantBit(k_val=2, compress_level=0)
+        self.assertGreater(len(fast.encode_image(stego_data)),
+                           len(self.stego.encode_image(stego_data)))
+        encoded = fast.save_image(stego_data, self.output_image_path)
+        with open(self.output_image_path, 'rb') as output_file:
+            self.assertEqual(output_file.read(), encoded)
+        # The embed methods can hand back the bytes they wrote
+        for embed, payload in ((self.stego.embed_message, "served"),
+                               (self.stego.embed_payload, b"served")):
+            stego_image, encoded = embed(
+                self.input_image_path, self.output_image_path, payload, return_encoded=True)
+            with open(self.output_image_path, 'rb') as output_file:
+                self.assertEqual(output_file.read(), encoded)
+            np.testing.assert_array_equal(
+                np.array(Image.open(io.BytesIO(encoded))), np.array(stego_image))
+        with self.assertRaises(ValueError):
+            LeastSignificantBit(k_val=2, output_format='JPEG')
+
+    def test_k_val_planner(self):
+        """Test that the planner picks the smallest fitting k_val and channel subset."""
+        shape, mode = LeastSignificantBit.carrier_geometry(self.input_image_path)
+        self.assertEqual((shape, mode), ((512, 512, 3), 'RGB'))
+        for k_val in range(1, 9):
+            capacity = LeastSignificantBit(k_val).payload_capacity(512 * 512 * 3)
+            self.assertEqual(LeastSignificantBit.plan(capacity, shape, mode), (k_val, None))
+            if k_val < 8:
+                self.assertEqual(LeastSignificantBit.plan(capacity + 1, shape, mode),
+                                 (k_val + 1, None))
+        with self.assertRaises(ValueError):
+            LeastSignificantBit.plan(512 * 512 * 3, shape, mode)
+
+        # Blue alone first, alpha last
+        self.assertEqual(LeastSignificantBit.plan(500, (64, 64, 4), 'RGBA', True), (1, (2,)))
+        self.assertEqual(LeastSignificantBit.plan(1000, (64, 64, 4), 'RGBA', True),
+                         (1, (0, 2)))
+        self.assertEqual(LeastSignificantBit.plan(2000, (64, 64, 4), 'RGBA', True),
+                         (1, None))
+
+    def test_shard_k_val_planner(self):
+        """Test that the shard planner uses the combined capacity of all carriers."""
+        shapes = [(40, 40, 3), (64, 32, 3)]
+        for k_val in range(1, 9):
+            lsb = LeastSignificantBit(k_val)
+            capacity = sum(lsb.payload_capacity(int(np.prod(shape))) - lsb.SHARD_HEADER_SIZE
+                           for shape in shapes)
+            self.assertEqual(LeastSignificantBit.plan_shards(capacity, shapes), k_val)
+            if k_val < 8:
+                self.assertEqual(LeastSignificantBit.plan_shards(capacity + 1, shapes),
+                                 k_val + 1)
+        with self.assertRaises(ValueError):
+            LeastSignificantBit.plan_shards(40 * 40 * 3 + 64 * 32 * 3, shapes)
+        # A carrier too small for a shard header at k_val=1 raises the k_val
+        self.assertEqual(LeastSignificantBit.plan_shards(1, [(40, 40, 3), (8, 8, 3)]), 2)
+        with self.assertRaises(ValueError) as context:
+            LeastSignificantBit.plan_shards(1, [(40, 40, 3), (6, 6, 3)])
+        self.assertIn("Carrier 1", str(context.exception))
+
+    def test_channel_subset_round_trip(self):
+        """Test that a planned channel subset is embedded there and read back from the header."""
+        rng = np.random.default_rng(3)
+        carrier = rng.integers(0, 256, size=(64, 64, 4), dtype=np.uint8)
+        for channel_count in (1, 3):
+            payload = rng.bytes(500 * channel_count)
+            k_val, channels = LeastSignificantBit.plan(
+                len(payload), carrier.shape, 'RGBA', channel_subset=True)
+            stego_data = LeastSignificantBit(k_val, channels=channels).embed(carrier, payload)
+            self.assertEqual(LeastSignificantBit.read_header(stego_data),
+                             (k_val, channels, len(payload)))
+            # Only the header, in the first 26 pixels, touches alpha
+            np.testing.assert_array_equal(stego_data.reshape(-1, 4)[26:, 3],
+                                          carrier.reshape(-1, 4)[26:, 3])
+            self.assertEqual(LeastSignificantBit.from_header(stego_data).extract(stego_data),
+                             payload)
+            with self.assertRaises(ValueError):
+                LeastSignificantBit(k_val).extract(stego_data)
+
+            # Small bands that split pixels, on threads, give the same stego pixels
+            banded = LeastSignificantBit(k_val, band_values=40, workers=4, channels=channels)
+            np.testing.assert_array_equal(banded.embed(carrier, payload), stego_data)
+            self.assertEqual(banded.extract(stego_data), payload)
+        with self.assertRaises(ValueError):
+            LeastSignificantBit(channels=(3,)).embed(self.image_data, b"no alpha")
+
 
 # Run the tests
 unittest.main(argv=[''], verbosity=2, exit=False)
@@ -4,6 +4,7 @@ from EllipticCurveElGamal import EllipticCurveElGamal
 from HuffmanEncoding import HuffmanEncoding
 from LampelZivWelch import LampelZivWelch
 from LeastSignificantBit import LeastSignificantBit
+from quality_metrics_panel import show_quality_metrics
 from PIL import Image
 import io
 import pickle
@@ -16,7 +17,7 @@ ktp_generator = DummyKTPGenerator()
 
 @st.cache_resource
 def initialize_ecc():
-    return EllipticCurveElGamal()
+    return EllipticCurveElGamal(use_tables=True)
 
 
 @st.cache_data
@@ -54,9 +55,16 @@ else:
 
 # Sidebar: LSB Configuration
 st.sidebar.subheader("LSB Configuration")
+auto_k_val = st.sidebar.checkbox(
+    "Pick the smallest k_val automatically", value=True)
 k_val = st.sidebar.slider("Number of LSBs (k_val)",
-                          min_value=1, max_value=8, value=4)
-lsb = LeastSignificantBit(k_val=k_val)
+                          min_value=1, max_value=8, value=4, disabled=auto_k_val)
+output_format = st.sidebar.selectbox(
+    "Stego Image Format", ["PNG", "BMP", "TIFF"])
+compress_level = st.sidebar.slider(
+    "PNG Compression Level (0 = fastest)", min_value=0, max_value=9, value=1)
+lsb = LeastSignificantBit(
+    k_val=k_val, output_format=output_format, compress_level=compress_level)
 
 # Sidebar Navigation
 app_mode = st.sidebar.selectbox(
@@ -87,7 +95,7 @@ if app_mode == "Generate, Encrypt & Embed":
     st.subheader("2. Encrypt Data with Elliptic Curve ElGamal (ECEG)")
     if st.session_state["private_key"] and st.session_state["public_key"]:
         if st.button("Encrypt"):
-            ciphertext = ecc.encrypt_message(
+            ciphertext = ecc.encrypt_message_batch(
                 user_text, st.session_state["public_key"])
             st.session_state["ciphertext"] = ciphertext
             st.success("Data encrypted successfully!")
@@ -131,21 +139,18 @@ if app_mode == "Generate, Encrypt & Embed":
 
     # Step 4: Embed into an Image
     st.subheader("4. Embed Data into an Image")
-    uploaded_image = st.file_uploader(
-        "Upload an image to embed the data:", type=["png", "jpg", "jpeg"]
+    uploaded_images = st.file_uploader(
+        "Upload one image, or several to spread the data across them:",
+        type=["png", "jpg", "jpeg"],
+        accept_multiple_files=True,
     )
-    if uploaded_image and "ciphertext" in st.session_state:
-        # Read the uploaded image
-        input_image = Image.open(uploaded_image)
-        st.image(input_image, caption="Uploaded Image Preview",
-                 use_column_width=True)
-
-        # Calculate maximum message length
-        img_width, img_height = input_image.size
-        color_channels = len(input_image.getbands())
-        max_message_length = (
-            (img_width * img_height * color_channels * k_val) - 1) // 8
-        st.info(f"Maximum Message Length: {max_message_length} characters")
+    if uploaded_images and "ciphertext" in st.session_state:
+        # Read the uploaded images
+        input_images = [Image.open(uploaded_image)
+                        for uploaded_image in uploaded_images]
+        for input_image in input_images:
+            st.image(input_image, caption="Uploaded Image Preview",
+                     use_column_width=True)
 
         # Input the message to embed
         data_to_embed = (
@@ -153,35 +158,83 @@ if app_mode == "Generate, Encrypt & Embed":
             if compress_option != "None"
             else st.session_state["ciphertext"]
         )
+
+        if auto_k_val and len(input_images) == 1:
+            # Plan from the image header; the choice is stored in the stego header
+            shape, mode = LeastSignificantBit.carrier_geometry(input_images[0])
+            try:
+                planned_k_val, channels = LeastSignificantBit.plan(
+                    len(data_to_embed.encode("utf-8")), shape, mode, channel_subset=True)
+                lsb = LeastSignificantBit(
+                    k_val=planned_k_val, output_format=output_format,
+                    compress_level=compress_level, channels=channels)
+                st.info(f"Planned k_val: {planned_k_val}, channels: "
+                        f"{'all' if channels is None else ', '.join(map(str, channels))}")
+            except ValueError as e:
+                st.warning(str(e))
+        elif auto_k_val:
+            # Plan over the combined capacity; embed_shards uses all channels
+            shapes = [LeastSignificantBit.carrier_geometry(input_image)[0]
+                      for input_image in input_images]
+            try:
+                planned_k_val = LeastSignificantBit.plan_shards(
+                    len(data_to_embed.encode("utf-8")), shapes)
+                lsb = LeastSignificantBit(
+                    k_val=planned_k_val, output_format=output_format,
+                    compress_level=compress_level)
+                st.info(f"Planned k_val: {planned_k_val}")
+            except ValueError as e:
+                st.warning(str(e))
+
+        # Calculate maximum payload length (bytes behind the payload header)
+        capacities = [
+            lsb.payload_capacity(
+                input_image.size[0] * input_image.size[1] * len(input_image.getbands()),
+                len(input_image.getbands()))
+            for input_image in input_images
+        ]
+        if len(input_images) > 1:
+            # Every image must hold its shard header, as embed_shards requires
+            max_message_length = sum(
+                capacity - lsb.SHARD_HEADER_SIZE for capacity in capacities)
+            if min(capacities) < lsb.SHARD_HEADER_SIZE:
+                max_message_length = 0
+                st.warning("An image is too small to hold a shard header; remove it.")
+        else:
+            max_message_length = capacities[0]
+        st.info(f"Maximum Message Length: {max_message_length} bytes")
         output_file_name = st.text_input(
-            "Output File Name", value="stego_image.png")
+            "Output File Name", value=f"stego_image.{output_format.lower()}")
 
-        if len(data_to_embed) > max_message_length:
-            st.error("Data exceeds the maximum length!")
+        if len(data_to_embed.encode("utf-8")) > max_message_length:
+            st.error("Data exceeds the maximum length! Upload more images.")
         elif st.button("Embed Message"):
             try:
-                # Embed the message
-                buffer = io.BytesIO()
-                input_image.save(buffer, format="PNG")
-                buffer.seek(0)
-                stego_image = lsb.embed_message(
-                    buffer, output_file_name, data_to_embed)
+                # Embed the message in memory; framed payload because
+                # LZW/Huffman output may contain chr(0)
+                if len(input_images) > 1:
+                    stego_data = lsb.embed_shards(input_images, data_to_embed)
+                else:
+                    stego_data = [lsb.embed(input_images[0], data_to_embed)]
 
                 st.success("Data embedded into the image successfully!")
-                st.image(stego_image, caption="Stego Image Preview",
-                         use_column_width=True)
-
-                # Prepare stego image for download
-                buffer = io.BytesIO()
-                stego_image.save(buffer, format="PNG")
-                buffer.seek(0)
-
-                st.download_button(
-                    label="Download Stego Image",
-                    data=buffer.getvalue(),
-                    file_name="stego_image.png",
-                    mime="image/png",
-                )
+                stem = output_file_name.rsplit(".", 1)[0]
+                for index, img_data in enumerate(stego_data):
+                    st.image(img_data, caption="Stego Image Preview",
+                             use_column_width=True)
+
+                    # Distortion introduced by the embedding
+                    show_quality_metrics(input_images[index], img_data)
+
+                    # Encode the stego image once, for download
+                    st.download_button(
+                        label="Download Stego Image",
+                        data=lsb.encode_image(img_data),
+                        file_name=(output_file_name if len(stego_data) == 1
+                                   else f"{stem}_{index + 1}.{output_format.lower()}"),
+                        mime=lsb.OUTPUT_FORMATS[output_format],
+                        key=f"download_stego_{index}",
+                    )
             except Exception as e:
                 st.error(f"An error occurred: {e}")
 
@@ -192,22 +245,27 @@ elif app_mode == "Extract, Decrypt & Recover":
 
     # Step 1: Extract Data from an Image
     st.subheader("1. Extract Data from an Image")
-    uploaded_stego_image = st.file_uploader(
-        "Upload the stego image:", type=["png", "jpg", "jpeg"])
-    if uploaded_stego_image:
-        stego_image = Image.open(uploaded_stego_image)
-        st.image(stego_image, caption="Stego Image Preview",
-                 use_column_width=True)
-
-        # Prepare the stego image as a binary stream
-        buffer = io.BytesIO()
-        stego_image.save(buffer, format="PNG")
-        buffer.seek(0)
+    uploaded_stego_images = st.file_uploader(
+        "Upload the stego image(s):", type=["png", "bmp", "tif", "tiff", "jpg", "jpeg"],
+        accept_multiple_files=True)
+    if uploaded_stego_images:
+        stego_images = [Image.open(uploaded_stego_image)
+                        for uploaded_stego_image in uploaded_stego_images]
+        for stego_image in stego_images:
+            st.image(stego_image, caption="Stego Image Preview",
+                     use_column_width=True)
 
         if st.button("Extract Message"):
             try:
-                # Extract message
-                extracted_data = lsb.extract_message(buffer)
+                # Extract message with the k_val and channels stored in its header
+                lsb = LeastSignificantBit.from_header(
+                    stego_images[0], output_format=output_format,
+                    compress_level=compress_level)
+                if len(stego_images) > 1:
+                    extracted_bytes = lsb.extract_shards(stego_images)
+                else:
+                    extracted_bytes = lsb.extract(stego_images[0])
+                extracted_data = extracted_bytes.decode("utf-8")
                 st.session_state["extracted_data"] = extracted_data
                 st.success("Message extracted successfully!")
                 st.code(extracted_data, language="text")
@@ -251,7 +309,7 @@ elif app_mode == "Extract, Decrypt & Recover":
             "Enter your private key:", type="password")
         if private_key_input and st.button("Decrypt"):
             try:
-                decrypted_data = ecc.decrypt_message(
+                decrypted_data = ecc.decrypt_message_batch(
                     data_to_decrypt, int(private_key_input))
                 st.success("Data decrypted successfully!")
                 st.text_area("Decrypted Message:", decrypted_data, height=200)
@@ -6,7 +6,7 @@ from EllipticCurveElGamal import EllipticCurveElGamal  # Import EllipticCurveElG
 
 @st.cache_resource
 def initialize_ecc():
-    return EllipticCurveElGamal()
+    return EllipticCurveElGamal(use_tables=True)
 
 # Cached function to generate keys
 
@@ -70,7 +70,7 @@ if message and st.session_state["public_key"]:
 
     if st.button("Encrypt"):
         try:
-            st.session_state["ciphertext"] = ecc.encrypt_message(
+            st.session_state["ciphertext"] = ecc.encrypt_message_batch(
                 message, st.session_state["public_key"]
             )
             st.success("Message encrypted successfully!")
@@ -98,7 +98,7 @@ if st.session_state["ciphertext"]:
         try:
             input_private_key = int(input_private_key)
             if st.button("Decrypt"):
-                st.session_state["decrypted_data"] = ecc.decrypt_message(
+                st.session_state["decrypted_data"] = ecc.decrypt_message_batch(
                     st.session_state["ciphertext"], input_private_key
                 )
                 st.success("Message decrypted successfully!")
@@ -1,7 +1,7 @@
 import streamlit as st
 from PIL import Image
 from LeastSignificantBit import LeastSignificantBit
-import io
+from quality_metrics_panel import show_quality_metrics
 
 # App title
 st.title("LSB Steganography")
@@ -70,8 +70,9 @@ if option == "Embed Message":
                     input_image.save("temp_input_image.png")
 
                     # Embed the message
-                    stego_image = lsb.embed_message(
-                        "temp_input_image.png", output_file_name, message
+                    stego_image, encoded = lsb.embed_message(
+                        "temp_input_image.png", output_file_name, message,
+                        return_encoded=True
                     )
 
                     st.session_state.stego_image = stego_image  # Store the stego image
@@ -85,17 +86,15 @@ if option == "Embed Message":
                     st.image(stego_image, caption="Stego Image Preview",
                              use_column_width=True)
 
-                    # Prepare the image for download
-                    buffer = io.BytesIO()
-                    stego_image.save(buffer, format="PNG")
-                    # Reset the pointer to the start of the buffer
-                    buffer.seek(0)
+                    # Distortion introduced by the embedding
+                    show_quality_metrics(input_image, stego_image)
 
+                    # Serve the PNG bytes already written to disk
                     st.download_button(
                         label="Download Stego Image",
-                        data=buffer.getvalue(),  # Get the binary data for download
+                        data=encoded,
                         file_name=output_file_name,
-                        mime="image/png",
+                        mime=lsb.OUTPUT_FORMATS["PNG"],
                     )
                 except Exception as e:
                     st.error(f"An error occurred: {e}")
@@ -0,0 +1,24 @@
+import numpy as np
+import streamlit as st
+from LeastSignificantBit import ImageQualityMetrics
+
+
+def show_quality_metrics(cover, stego):
+    """
+    Show the distortion a stego image has relative to its cover.
+
+    Failures are reported as a warning so they never hide a successful embed.
+    """
+    try:
+        metrics = ImageQualityMetrics.compare(
+            np.asarray(cover), np.asarray(stego), band_rows=ImageQualityMetrics.BAND_ROWS)
+    except Exception as e:
+        st.warning(f"Could not compute the image quality metrics: {e}")
+        return
+
+    mse_col, psnr_col, ssim_col = st.columns(3)
+    mse_col.metric("MSE", f"{metrics['mse']:.4f}")
+    psnr_col.metric("PSNR", f"{metrics['psnr']:.2f} dB")
+    # SSIM is undefined for images smaller than its window
+    ssim_col.metric("SSIM", "n/a" if metrics['ssim'] is None else f"{metrics['ssim']:.4f}")
+    st.write("Histogram difference per channel:", metrics['histogram_delta'])